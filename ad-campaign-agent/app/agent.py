@@ -21,6 +21,7 @@ Architecture:
     Coordinator Agent (root_agent)
     ├── Campaign Agent - Campaign CRUD and location features
     ├── Media Agent - Image and video generation (Veo 3.1, Gemini 3 Pro Image)
+    ├── Review Agent - HITL video review and activation
     └── Analytics Agent - Metrics, insights, and data visualization
 
 Target Users: Campaign Manager, Creative Director, Store Operations Manager,
@@ -36,13 +37,41 @@ Usage:
 """
 
 from google.adk.agents import LlmAgent
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.apps import App
+from google.adk.models import Gemini
+from google.genai import types
 # NOTE: BuiltInCodeExecutor cannot be used with function calling tools
 # It's mutually exclusive - you get either tools OR code execution, not both
 # For chart generation, consider a separate visualization agent without tools
 
-from .config import MODEL, APP_NAME, APP_DESCRIPTION
-from .database.db import init_database
+from .config import (
+    MODEL,
+    ROUTER_MODEL,
+    APP_NAME,
+    APP_DESCRIPTION,
+    COORDINATOR_TEMPERATURE,
+    CONTEXT_CACHE_MIN_TOKENS,
+    CONTEXT_CACHE_TTL_SECONDS,
+    CONTEXT_CACHE_INTERVALS,
+    WARMUP_ON_START,
+)
+from .callbacks import (
+    before_model_cache_lookup,
+    after_model_cache_store,
+    before_model_semantic_route,
+    after_model_record_route,
+    after_tool_render_direct,
+    after_agent_emit_direct,
+)
+from .database.db import (
+    init_database,
+    is_database_initialized,
+    set_schema_version,
+    start_background_bootstrap,
+)
 from .database.mock_data import populate_mock_data
+from .tools.concurrency import parallel_tools
 
 # Import all tools
 from .tools.campaign_tools import (
@@ -68,6 +97,7 @@ from .tools.video_tools import (
     # New two-stage pipeline tools
     generate_video_from_product,
     generate_video_with_variation,
+    generate_video_batch,
     list_products,
     list_campaign_videos,
     get_variation_presets,
@@ -102,19 +132,48 @@ from .tools.maps_tools import (
     generate_static_map,
 )
 
-# Initialize database and populate mock data on import
-# Wrapped in try-except for better error reporting in Agent Engine
+# Initialize database and populate mock data in the background on import
+# Skipped when PRAGMA user_version shows the current schema is already in
+# place, so re-imports (adk web / api_server workers) cost a single read.
+# On first run the seeding happens on a daemon thread so import returns
+# immediately; get_db_cursor() waits for it, and a failure is logged and
+# re-raised from the first tool that touches the database.
 import sys
 from .config import DB_PATH
-try:
+
+
+def _bootstrap_database() -> None:
     init_database()
     populate_mock_data()
+    set_schema_version()
+
+
+try:
+    if not is_database_initialized():
+        start_background_bootstrap(_bootstrap_database)
 except Exception as e:
     print(f"[Agent Init] Database initialization error: {e}", file=sys.stderr)
     print(f"[Agent Init] DB_PATH attempted: {DB_PATH}", file=sys.stderr)
     # Re-raise to fail fast with clear error
     raise
 
+# One model instance for all sub-agents, so they share a single genai client
+# (credentials, refresh timers and connection pool) instead of each agent
+# resolving the MODEL string to its own client. The coordinator routes on
+# the smaller ROUTER_MODEL.
+shared_model = Gemini(model=MODEL)
+router_model = Gemini(model=ROUTER_MODEL)
+
+
+def _compile_instruction(text: str) -> types.Content:
+    """Build the system instruction Content once, at import.
+
+    Passed as static_instruction, it is sent verbatim on every request
+    (and forms the cacheable prefix) instead of being re-scanned for
+    {state} placeholders and rebuilt from the string each turn.
+    """
+    return types.Content(parts=[types.Part(text=text)])
+
 # =============================================================================
 # Campaign Agent - Handles campaign CRUD and location features
 # =============================================================================
@@ -158,11 +217,11 @@ The system has 4 product-centric campaigns:
 """
 
 campaign_agent = LlmAgent(
-    model=MODEL,
+    model=shared_model,
     name="campaign_agent",
     description="Manages ad campaigns: create, list, view, update campaigns and handle location/map features",
-    instruction=CAMPAIGN_AGENT_INSTRUCTION,
-    tools=[
+    static_instruction=_compile_instruction(CAMPAIGN_AGENT_INSTRUCTION),
+    tools=parallel_tools([
         create_campaign,
         list_campaigns,
         get_campaign,
@@ -170,7 +229,10 @@ campaign_agent = LlmAgent(
         get_campaign_locations,
         search_nearby_stores,
         get_location_demographics,
-    ],
+    ]),
+    # Deterministic list tools reply directly, skipping the LLM summary
+    after_tool_callback=after_tool_render_direct,
+    after_agent_callback=after_agent_emit_direct,
 )
 
 # =============================================================================
@@ -211,18 +273,22 @@ Use generate_video_from_product(campaign_id, product_id) for default generation.
 Pass an optional variation dict: generate_video_from_product(campaign_id, product_id, {"setting": "beach", "mood": "romantic"})
 
 ## Creative Variations (NEW)
-Videos can be customized with variation parameters (as dict):
-- **model_ethnicity**: asian, european, african, latina, south-asian, diverse
-- **setting**: studio, beach, urban, cafe, rooftop, garden, nature, etc.
-- **mood**: elegant, romantic, bold, playful, sophisticated, energetic, serene
-- **lighting**: natural, studio, dramatic, soft, golden-hour, neon, moody
-- **activity**: walking, standing, sitting, dancing, spinning, posing
-- **camera_movement**: orbit, pan, dolly, static, tracking, crane
-- **time_of_day**: golden-hour, sunrise, day, sunset, dusk, night
-- **visual_style**: cinematic, editorial, commercial, artistic
-- **energy**: calm, moderate, dynamic, high-energy
+Videos can be customized with variation parameters (as dict). Allowed values per key:
+```json
+{"model_ethnicity":["asian","european","african","latina","south-asian","diverse"],
+"setting":["studio","beach","urban","cafe","rooftop","garden","nature"],
+"mood":["elegant","romantic","bold","playful","sophisticated","energetic","serene"],
+"lighting":["natural","studio","dramatic","soft","golden-hour","neon","moody"],
+"activity":["walking","standing","sitting","dancing","spinning","posing"],
+"camera_movement":["orbit","pan","dolly","static","tracking","crane"],
+"time_of_day":["golden-hour","sunrise","day","sunset","dusk","night"],
+"visual_style":["cinematic","editorial","commercial","artistic"],
+"energy":["calm","moderate","dynamic","high-energy"]}
+```
+Settings are not limited to the list above; other locations can be described freely.
 
 Use generate_video_with_variation() to specify variation parameters individually.
+Use generate_video_batch(campaign_id, product_id, [variation, ...]) for several variations at once (A/B tests); they are generated in parallel.
 Use get_variation_presets() to see preset variation sets (diversity, settings, moods).
 
 ## HITL Workflow (NEW - IMPORTANT)
@@ -251,20 +317,26 @@ Use list_campaign_videos(status='generated') to see pending videos.
 - Remind users that videos need activation to go live
 - Highlight that thumbnails are available for preview
 - Guide users to Review Agent for activation
+- Call independent tools in one turn (e.g. list_products and
+  list_campaign_videos together) so they run in parallel
 """
 
 media_agent = LlmAgent(
-    model=MODEL,
+    model=shared_model,
     name="media_agent",
     description="Generates videos using two-stage pipeline (scene image → video animation) with creative variations. Browses 22 pre-loaded products, generates videos with variation parameters (model ethnicity, setting, mood, lighting, etc.), and lists generated videos. Videos start with status='generated' and must be activated by Review Agent.",
-    instruction=MEDIA_AGENT_INSTRUCTION,
-    tools=[
+    static_instruction=_compile_instruction(MEDIA_AGENT_INSTRUCTION),
+    # A fixed declaration list, not a RetrievalToolset: tools are part of the
+    # context cache fingerprint (see context_cache_config on App below), so
+    # trimming them per turn would recreate the cache on every message.
+    tools=parallel_tools([
         # Product browsing (NEW)
         list_products,
         get_variation_presets,
         # Two-stage pipeline video generation (NEW - PRIMARY)
         generate_video_from_product,
         generate_video_with_variation,
+        generate_video_batch,
         list_campaign_videos,
         # Legacy image tools
         add_seed_image,
@@ -279,7 +351,10 @@ media_agent = LlmAgent(
         generate_video_with_properties,
         get_video_properties,
         analyze_video,
-    ],
+    ]),
+    # Deterministic list tools reply directly, skipping the LLM summary
+    after_tool_callback=after_tool_render_direct,
+    after_agent_callback=after_agent_emit_direct,
 )
 
 # =============================================================================
@@ -360,14 +435,16 @@ All AI visualizations use Gemini 3 Pro Image and saved as artifacts.
   3. Offer generate_map_visualization() for AI-generated infographics
 - Format data in clear tables when appropriate
 - Include clickable Google Maps links when showing locations
+- Request independent data in one turn (e.g. get_campaign_metrics and
+  get_top_performing_ads together) so the tools run in parallel
 """
 
 analytics_agent = LlmAgent(
-    model=MODEL,
+    model=shared_model,
     name="analytics_agent",
     description="Analyzes campaign metrics, finds top performers, generates insights, creates visual charts/infographics, and provides Google Maps integration with store locations, static maps, and AI-generated map visualizations",
-    instruction=ANALYTICS_AGENT_INSTRUCTION,
-    tools=[
+    static_instruction=_compile_instruction(ANALYTICS_AGENT_INSTRUCTION),
+    tools=parallel_tools([
         get_campaign_metrics,
         get_top_performing_ads,
         get_campaign_insights,
@@ -377,7 +454,7 @@ analytics_agent = LlmAgent(
         get_campaign_map_data,
         generate_static_map,
         generate_map_visualization,
-    ],
+    ]),
 )
 
 # =============================================================================
@@ -460,11 +537,11 @@ When a video is activated, the system generates 30 days of realistic mock metric
 """
 
 review_agent = LlmAgent(
-    model=MODEL,
+    model=shared_model,
     name="review_agent",
     description="Manages HITL video activation workflow: lists pending videos, activates videos to push live (generates metrics), pauses/archives videos, checks status. Videos must be activated before metrics appear.",
-    instruction=REVIEW_AGENT_INSTRUCTION,
-    tools=[
+    static_instruction=_compile_instruction(REVIEW_AGENT_INSTRUCTION),
+    tools=parallel_tools([
         # New review table tools (PRIMARY)
         get_video_review_table,
         get_video_details,
@@ -477,7 +554,10 @@ review_agent = LlmAgent(
         get_video_status,
         get_activation_summary,
         generate_additional_metrics,
-    ],
+    ]),
+    # Deterministic list tools reply directly, skipping the LLM summary
+    after_tool_callback=after_tool_render_direct,
+    after_agent_callback=after_agent_emit_direct,
 )
 
 # =============================================================================
@@ -547,9 +627,44 @@ User: "I want to promote the black trousers at the Chicago store"
 
 # Define the root coordinator agent with sub-agents
 root_agent = LlmAgent(
-    model=MODEL,
+    model=router_model,
     name=APP_NAME,
     description=APP_DESCRIPTION,
-    instruction=COORDINATOR_INSTRUCTION,
+    static_instruction=_compile_instruction(COORDINATOR_INSTRUCTION),
+    # Routing is deterministic, so identical turns are served from cache and
+    # paraphrases of already-routed messages are transferred directly.
+    # VALIDATED mode constrains any function call to its schema, so a
+    # transfer can only name one of the sub-agents in transfer_to_agent's
+    # enum, while plain text replies (greetings, explanations) stay allowed.
+    generate_content_config=types.GenerateContentConfig(
+        temperature=COORDINATOR_TEMPERATURE,
+        tool_config=types.ToolConfig(
+            function_calling_config=types.FunctionCallingConfig(
+                mode=types.FunctionCallingConfigMode.VALIDATED,
+            ),
+        ),
+    ),
+    before_model_callback=[before_model_cache_lookup, before_model_semantic_route],
+    after_model_callback=[after_model_cache_store, after_model_record_route],
     sub_agents=[campaign_agent, media_agent, review_agent, analytics_agent],
 )
+
+# Prime clients in the background so the first turn skips the handshakes
+if WARMUP_ON_START:
+    from .warmup import start_warmup
+    start_warmup(root_agent)
+
+# ADK loaders pick up `app` before `root_agent`. Wrapping the agent tree in an
+# App enables Gemini context caching, so the constant instruction and tool
+# declaration prefix of every agent is cached server-side instead of being
+# re-processed on each turn. The App name must match the agent directory
+# that adk web / api_server route by.
+app = App(
+    name=__package__.rsplit(".", 1)[-1],
+    root_agent=root_agent,
+    context_cache_config=ContextCacheConfig(
+        min_tokens=CONTEXT_CACHE_MIN_TOKENS,
+        ttl_seconds=CONTEXT_CACHE_TTL_SECONDS,
+        cache_intervals=CONTEXT_CACHE_INTERVALS,
+    ),
+)
@@ -27,21 +27,56 @@ Solution: Force-set critical env vars in set_up() after super().set_up().
 See: https://github.com/google/adk-python/issues/3628#issuecomment-3666413473
 """
 
+import logging
 import os
+import threading
+from typing import Any, Dict, Optional, Union
 
 import vertexai
 from vertexai.agent_engines import AdkApp
 
-# Use a custom env var that Agent Engine doesn't override
-# GEMINI_MODEL_LOCATION is set in .env and passed via env_vars during deployment
-# Falls back to 'global' for Gemini 3 models
-GEMINI_MODEL_LOCATION = os.environ.get("GEMINI_MODEL_LOCATION", "global")
+from .config import GEMINI_MODEL_LOCATION
+
+# Debug-level only: Agent Engine ships stdout to Cloud Logging synchronously,
+# so unconditional prints here added latency to every cold start
+logger = logging.getLogger(__name__)
+
+# Start vertexai.init() (credential and project discovery) in a daemon thread
+# as soon as the module is imported, so it overlaps with unpickling and
+# importing the agent tree. The thread never holds up interpreter exit, and
+# set_up() joins it (re-raising any failure) before handing over to AdkApp.
+_vertexai_init_error: list = []
+
+
+def _run_vertexai_init() -> None:
+    try:
+        vertexai.init()
+    except Exception as e:
+        _vertexai_init_error.append(e)
+
+
+_vertexai_init = threading.Thread(
+    target=_run_vertexai_init, name="vertexai-init", daemon=True
+)
+_vertexai_init.start()
+
+
+# Stream partial responses (SSE) unless the caller overrides it, so users see
+# the reply as it decodes instead of after the whole sub-agent turn finishes
+DEFAULT_RUN_CONFIG = {"streaming_mode": "sse"}
+
+
+def _with_default_run_config(run_config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge the caller's run_config over DEFAULT_RUN_CONFIG."""
+    return {**DEFAULT_RUN_CONFIG, **(run_config or {})}
+
 
 # Debug: Log at module import time
-print(f"[GlobalAdkApp] Module imported")
-print(f"[GlobalAdkApp] GEMINI_MODEL_LOCATION = {GEMINI_MODEL_LOCATION}")
-print(f"[GlobalAdkApp] GOOGLE_CLOUD_LOCATION (at import) = {os.environ.get('GOOGLE_CLOUD_LOCATION', 'NOT SET')}")
-print(f"[GlobalAdkApp] GOOGLE_GENAI_USE_VERTEXAI (at import) = {os.environ.get('GOOGLE_GENAI_USE_VERTEXAI', 'NOT SET')}")
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug("[GlobalAdkApp] Module imported")
+    logger.debug("[GlobalAdkApp] GEMINI_MODEL_LOCATION = %s", GEMINI_MODEL_LOCATION)
+    logger.debug("[GlobalAdkApp] GOOGLE_CLOUD_LOCATION (at import) = %s", os.environ.get("GOOGLE_CLOUD_LOCATION", "NOT SET"))
+    logger.debug("[GlobalAdkApp] GOOGLE_GENAI_USE_VERTEXAI (at import) = %s", os.environ.get("GOOGLE_GENAI_USE_VERTEXAI", "NOT SET"))
 
 
 class GlobalAdkApp(AdkApp):
@@ -50,6 +85,7 @@ class GlobalAdkApp(AdkApp):
     Agent Engine overrides GOOGLE_CLOUD_LOCATION to match the deployment region
     (us-central1). This subclass restores it to the value from GEMINI_MODEL_LOCATION
     (or 'global' by default) after setup, allowing Gemini 3 models to work.
+    Queries stream partial responses (SSE) unless run_config says otherwise.
 
     Usage:
         from app.agent_engine_app import GlobalAdkApp
@@ -62,26 +98,65 @@ class GlobalAdkApp(AdkApp):
 
     def set_up(self) -> None:
         """Initialize the app and restore critical env vars for Gemini 3 and Vertex AI."""
-        print(f"[GlobalAdkApp.set_up] Starting set_up...")
-        print(f"[GlobalAdkApp.set_up] GOOGLE_CLOUD_LOCATION (before vertexai.init) = {os.environ.get('GOOGLE_CLOUD_LOCATION', 'NOT SET')}")
-        print(f"[GlobalAdkApp.set_up] GOOGLE_GENAI_USE_VERTEXAI (before vertexai.init) = {os.environ.get('GOOGLE_GENAI_USE_VERTEXAI', 'NOT SET')}")
+        logger.debug("[GlobalAdkApp.set_up] Starting set_up...")
+        logger.debug("[GlobalAdkApp.set_up] GOOGLE_CLOUD_LOCATION (before vertexai.init) = %s", os.environ.get("GOOGLE_CLOUD_LOCATION", "NOT SET"))
+        logger.debug("[GlobalAdkApp.set_up] GOOGLE_GENAI_USE_VERTEXAI (before vertexai.init) = %s", os.environ.get("GOOGLE_GENAI_USE_VERTEXAI", "NOT SET"))
 
-        # Initialize Vertex AI
-        vertexai.init()
-        print(f"[GlobalAdkApp.set_up] GOOGLE_CLOUD_LOCATION (after vertexai.init) = {os.environ.get('GOOGLE_CLOUD_LOCATION', 'NOT SET')}")
+        # Initialize Vertex AI (started in the background at import)
+        _vertexai_init.join()
+        if _vertexai_init_error:
+            raise _vertexai_init_error[0]
+        logger.debug("[GlobalAdkApp.set_up] GOOGLE_CLOUD_LOCATION (after vertexai.init) = %s", os.environ.get("GOOGLE_CLOUD_LOCATION", "NOT SET"))
 
         # Parent set_up() is where the GOOGLE_CLOUD_LOCATION override occurs
         super().set_up()
-        print(f"[GlobalAdkApp.set_up] GOOGLE_CLOUD_LOCATION (after super().set_up) = {os.environ.get('GOOGLE_CLOUD_LOCATION', 'NOT SET')}")
+        logger.debug("[GlobalAdkApp.set_up] GOOGLE_CLOUD_LOCATION (after super().set_up) = %s", os.environ.get("GOOGLE_CLOUD_LOCATION", "NOT SET"))
 
         # Restore the location for Gemini 3 models (from GEMINI_MODEL_LOCATION or default 'global')
         os.environ["GOOGLE_CLOUD_LOCATION"] = GEMINI_MODEL_LOCATION
-        print(f"[GlobalAdkApp.set_up] GOOGLE_CLOUD_LOCATION (after restore) = {os.environ.get('GOOGLE_CLOUD_LOCATION', 'NOT SET')}")
+        logger.debug("[GlobalAdkApp.set_up] GOOGLE_CLOUD_LOCATION (after restore) = %s", os.environ.get("GOOGLE_CLOUD_LOCATION", "NOT SET"))
 
         # Force-set GOOGLE_GENAI_USE_VERTEXAI=TRUE for video generation
         # This is required for Veo video byte extraction via Vertex AI
         # Agent Engine may not properly propagate env_vars (ADK bug #3208)
         os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "TRUE"
-        print(f"[GlobalAdkApp.set_up] GOOGLE_GENAI_USE_VERTEXAI (forced) = {os.environ.get('GOOGLE_GENAI_USE_VERTEXAI', 'NOT SET')}")
+        logger.debug("[GlobalAdkApp.set_up] GOOGLE_GENAI_USE_VERTEXAI (forced) = %s", os.environ.get("GOOGLE_GENAI_USE_VERTEXAI", "NOT SET"))
+
+        logger.debug("[GlobalAdkApp.set_up] set_up complete!")
+
+    def stream_query(
+        self,
+        *,
+        message: Union[str, Dict[str, Any]],
+        user_id: str,
+        session_id: Optional[str] = None,
+        run_config: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ):
+        """Stream events, with SSE streaming enabled by default."""
+        yield from super().stream_query(
+            message=message,
+            user_id=user_id,
+            session_id=session_id,
+            run_config=_with_default_run_config(run_config),
+            **kwargs,
+        )
 
-        print(f"[GlobalAdkApp.set_up] set_up complete!")
+    async def async_stream_query(
+        self,
+        *,
+        message: Union[str, Dict[str, Any]],
+        user_id: str,
+        session_id: Optional[str] = None,
+        run_config: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ):
+        """Stream events asynchronously, with SSE streaming enabled by default."""
+        async for event in super().async_stream_query(
+            message=message,
+            user_id=user_id,
+            session_id=session_id,
+            run_config=_with_default_run_config(run_config),
+            **kwargs,
+        ):
+            yield event
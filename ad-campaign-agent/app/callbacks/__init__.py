@@ -0,0 +1,41 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Model callbacks shared by the ad campaign agents."""
+
+from .llm_cache import (
+    before_model_cache_lookup,
+    after_model_cache_store,
+    llm_response_cache,
+)
+from .direct_response import (
+    after_tool_render_direct,
+    after_agent_emit_direct,
+)
+from .semantic_router import (
+    before_model_semantic_route,
+    after_model_record_route,
+    semantic_router,
+)
+
+__all__ = [
+    "before_model_cache_lookup",
+    "after_model_cache_store",
+    "llm_response_cache",
+    "after_tool_render_direct",
+    "after_agent_emit_direct",
+    "before_model_semantic_route",
+    "after_model_record_route",
+    "semantic_router",
+]
@@ -0,0 +1,171 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Render deterministic list/lookup tool results without an LLM summary.
+
+Tools like list_campaigns or get_video_review_table already return
+everything the user asked for. Letting the model restate them costs a
+second LLM round trip (several seconds) and adds nothing. For these tools
+the after-tool callback sets skip_summarization and renders the result to
+Markdown, and the after-agent callback emits that Markdown as the agent's
+reply.
+
+ADK merges the actions of parallel function responses, so one skipped
+summary ends the whole turn. Summarization is therefore only skipped once
+every function call of the model response has been rendered; if any call
+in the turn has no renderer (or failed), the model summarizes them all.
+
+Usage:
+    LlmAgent(
+        ...,
+        after_tool_callback=after_tool_render_direct,
+        after_agent_callback=after_agent_emit_direct,
+    )
+"""
+
+import threading
+from typing import Any, Callable, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.tools import BaseTool, ToolContext
+from google.genai import types
+
+
+def _render_table(rows: list[dict], columns: list[tuple[str, str]]) -> str:
+    """Render rows as a Markdown table using (key, header) column pairs."""
+    lines = [
+        "| " + " | ".join(header for _, header in columns) + " |",
+        "|" + "|".join("---" for _ in columns) + "|",
+    ]
+    for row in rows:
+        cells = (str(row.get(key) if row.get(key) is not None else "") for key, _ in columns)
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def _render_campaigns(result: dict) -> str:
+    table = _render_table(result["campaigns"], [
+        ("id", "ID"), ("name", "Campaign"), ("location", "Location"),
+        ("status", "Status"), ("video_count", "Videos"),
+    ])
+    return f"**{result['total_count']} campaigns**\n\n{table}"
+
+
+def _render_products(result: dict) -> str:
+    rows = [
+        {**product, "image": f"[View]({product['image_url']})" if product.get("image_url") else ""}
+        for product in result["products"]
+    ]
+    table = _render_table(rows, [
+        ("id", "ID"), ("name", "Product"), ("category", "Category"),
+        ("color", "Color"), ("style", "Style"), ("image", "Image"),
+    ])
+    return f"**{result['product_count']} products**\n\n{table}"
+
+
+def _render_pending_videos(result: dict) -> str:
+    if not result["videos"]:
+        return result["message"]
+    table = _render_table(result["videos"], [
+        ("id", "ID"), ("campaign_name", "Campaign"),
+        ("variation_name", "Variation"), ("created_at", "Created"),
+    ])
+    return f"{result['message']}\n\n{table}"
+
+
+def _render_activation_summary(result: dict) -> str:
+    counts = "\n".join(
+        f"- {status}: {count}" for status, count in result["status_counts"].items()
+    )
+    return (
+        f"**{result['total_videos']} videos** "
+        f"({result['live']} live, {result['pending_review']} pending review)\n\n{counts}"
+    )
+
+
+# Tool name -> renderer. Results are only rendered for status == "success";
+# errors still go through the model so it can explain them.
+DIRECT_RESPONSE_RENDERERS: dict[str, Callable[[dict], str]] = {
+    "list_campaigns": _render_campaigns,
+    "list_products": _render_products,
+    "list_pending_videos": _render_pending_videos,
+    "get_activation_summary": _render_activation_summary,
+    "get_video_review_table": lambda result: result["table"],
+}
+
+# Invocation-scoped state (temp: keys are never persisted with the session).
+# call id -> rendered Markdown, or None when that call can't be rendered
+_RENDERED_CALLS_KEY = "temp:direct_response_calls"
+# Markdown waiting for after_agent_emit_direct
+_PENDING_KEY = "temp:direct_response"
+# Parallel tool callbacks of one turn update the same state entries
+_state_lock = threading.Lock()
+
+
+def _render(tool: BaseTool, tool_response: Any) -> Optional[str]:
+    renderer = DIRECT_RESPONSE_RENDERERS.get(tool.name)
+    if renderer is None or not isinstance(tool_response, dict):
+        return None
+    if tool_response.get("status") != "success":
+        return None
+    try:
+        return renderer(tool_response)
+    except (KeyError, TypeError):
+        return None
+
+
+def _turn_call_ids(tool_context: ToolContext) -> list[str]:
+    """Ids of every function call in the model response that ran this tool."""
+    call_id = tool_context.function_call_id
+    for event in reversed(tool_context.session.events):
+        calls = event.get_function_calls()
+        if any(call.id == call_id for call in calls):
+            return [call.id for call in calls]
+    return [call_id]
+
+
+def after_tool_render_direct(
+    tool: BaseTool,
+    args: dict[str, Any],
+    tool_context: ToolContext,
+    tool_response: Any,
+) -> Optional[dict]:
+    """Skip the LLM summary once every call in the turn has been rendered."""
+    call_ids = _turn_call_ids(tool_context)
+    with _state_lock:
+        rendered_calls = dict(tool_context.state.get(_RENDERED_CALLS_KEY) or {})
+        rendered_calls[tool_context.function_call_id] = _render(tool, tool_response)
+        tool_context.state[_RENDERED_CALLS_KEY] = rendered_calls
+
+        # Only the callback that completes the turn decides, and one skipped
+        # summary is enough since ADK merges the flags
+        if any(call_id not in rendered_calls for call_id in call_ids):
+            return None
+        rendered = [rendered_calls[call_id] for call_id in call_ids]
+        if any(text is None for text in rendered):
+            return None
+
+        tool_context.actions.skip_summarization = True
+        pending = list(tool_context.state.get(_PENDING_KEY) or [])
+        tool_context.state[_PENDING_KEY] = pending + rendered
+    return None
+
+
+def after_agent_emit_direct(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Reply with the Markdown queued by after_tool_render_direct, if any."""
+    rendered = callback_context.state.get(_PENDING_KEY)
+    if not rendered:
+        return None
+    callback_context.state[_PENDING_KEY] = []
+    return types.Content(role="model", parts=[types.Part(text="\n\n".join(rendered))])
@@ -0,0 +1,141 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Exact-match LLM response cache for deterministic (temperature 0) calls.
+
+The coordinator re-sends the same instruction, sub-agent declarations and
+conversation on every routing turn. When the request is byte-for-byte
+identical and sampling is deterministic, the previous response can be
+replayed without a network round trip.
+
+Usage:
+    LlmAgent(
+        ...,
+        before_model_callback=before_model_cache_lookup,
+        after_model_callback=after_model_cache_store,
+    )
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+
+from ..config import LLM_CACHE_MAX_ENTRIES, LLM_CACHE_TTL_SECONDS
+
+# State key used to hand the request hash from the before- to the
+# after-model callback. The temp: prefix keeps it out of persisted state.
+_CACHE_KEY_STATE = "temp:llm_cache_key"
+
+
+class LLMResponseCache:
+    """Thread-safe in-memory LRU cache of LlmResponse objects with a TTL."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, LlmResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[LlmResponse]:
+        """Return a copy of the cached response, or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return response.model_copy(deep=True)
+
+    def set(self, key: str, response: LlmResponse) -> None:
+        """Store a copy of the response, evicting the oldest entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response.model_copy(deep=True))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+llm_response_cache = LLMResponseCache(
+    ttl_seconds=LLM_CACHE_TTL_SECONDS,
+    max_entries=LLM_CACHE_MAX_ENTRIES,
+)
+
+
+def _is_deterministic(llm_request: LlmRequest) -> bool:
+    """Only temperature 0 requests are safe to replay."""
+    config = llm_request.config
+    return config is not None and config.temperature == 0
+
+
+def _request_cache_key(llm_request: LlmRequest) -> str:
+    """Hash model, system instruction, conversation and tool names."""
+    config = llm_request.config
+    payload = {
+        "model": llm_request.model,
+        "system": str(config.system_instruction) if config else None,
+        "messages": [
+            content.model_dump(mode="json", exclude_none=True)
+            for content in llm_request.contents
+        ],
+        "tools": sorted(llm_request.tools_dict),
+    }
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def before_model_cache_lookup(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """Return the cached response for an identical deterministic request."""
+    if not _is_deterministic(llm_request):
+        return None
+
+    key = _request_cache_key(llm_request)
+    cached = llm_response_cache.get(key)
+    if cached is not None:
+        return cached
+
+    callback_context.state[_CACHE_KEY_STATE] = key
+    return None
+
+
+def after_model_cache_store(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> Optional[LlmResponse]:
+    """Remember complete, successful responses for the pending request."""
+    key = callback_context.state.get(_CACHE_KEY_STATE)
+    if not key or llm_response.partial:
+        return None
+
+    callback_context.state[_CACHE_KEY_STATE] = None
+    if llm_response.error_code or not llm_response.content:
+        return None
+    llm_response_cache.set(key, llm_response)
+    return None
@@ -0,0 +1,193 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Semantic routing cache for coordinator delegation decisions.
+
+The coordinator's only job on a fresh user message is to pick a sub-agent,
+and users phrase the same intent many ways ("show me campaigns", "list
+campaigns", "what campaigns do I have"). Each routed message is embedded
+and remembered with the chosen agent; a later message whose embedding is
+close enough is transferred directly, skipping the coordinator LLM call.
+
+Usage:
+    LlmAgent(
+        ...,
+        before_model_callback=before_model_semantic_route,
+        after_model_callback=after_model_record_route,
+    )
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from google.genai import types
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+
+from ..config import ROUTER_MAX_ENTRIES, ROUTER_SIMILARITY_THRESHOLD, ROUTER_TTL_SECONDS
+from ..embeddings import cosine, embed_text
+
+logger = logging.getLogger(__name__)
+
+_TRANSFER_TOOL = "transfer_to_agent"
+
+# State key used to hand the message embedding from the before- to the
+# after-model callback. The temp: prefix keeps it out of persisted state.
+_EMBEDDING_STATE = "temp:semantic_router_embedding"
+
+
+def _embed(text: str) -> list[float]:
+    """Embed a user message as a unit vector."""
+    return embed_text(text)
+
+
+class SemanticRouter:
+    """Thread-safe store of (message embedding, sub-agent) routing decisions.
+
+    Vectors are unit length, so cosine similarity is a plain dot product.
+    Decisions expire after ttl_seconds, and the oldest are dropped once
+    max_entries is reached.
+    """
+
+    def __init__(self, threshold: float, max_entries: int, ttl_seconds: float):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._entries: deque = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def _evict_expired(self) -> None:
+        # Entries are appended in time order, so expired ones are at the left
+        now = time.monotonic()
+        while self._entries and self._entries[0][2] <= now:
+            self._entries.popleft()
+
+    def _best_match(self, embedding: list[float]) -> tuple[float, Optional[str]]:
+        best_score, best_agent = -1.0, None
+        for vector, agent_name, _ in self._entries:
+            score = cosine(vector, embedding)
+            if score > best_score:
+                best_score, best_agent = score, agent_name
+        return best_score, best_agent
+
+    def lookup(self, embedding: list[float]) -> Optional[str]:
+        """Return the sub-agent chosen for a similar message, if any."""
+        with self._lock:
+            self._evict_expired()
+            score, agent_name = self._best_match(embedding)
+        return agent_name if score >= self.threshold else None
+
+    def add(self, embedding: list[float], agent_name: str) -> None:
+        """Remember a routing decision made by the coordinator."""
+        with self._lock:
+            self._evict_expired()
+            expires_at = time.monotonic() + self.ttl_seconds
+            self._entries.append((tuple(embedding), agent_name, expires_at))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+semantic_router = SemanticRouter(
+    threshold=ROUTER_SIMILARITY_THRESHOLD,
+    max_entries=ROUTER_MAX_ENTRIES,
+    ttl_seconds=ROUTER_TTL_SECONDS,
+)
+
+
+def _latest_user_text(llm_request: LlmRequest) -> Optional[str]:
+    """Return the user's text if the request ends on a fresh user message.
+
+    Requests that end on a function response (the coordinator reacting to
+    a tool or transfer result) are not routing decisions.
+    """
+    if not llm_request.contents:
+        return None
+    last = llm_request.contents[-1]
+    if last.role != "user" or not last.parts:
+        return None
+    if any(part.function_response for part in last.parts):
+        return None
+    text = " ".join(part.text for part in last.parts if part.text).strip()
+    return text or None
+
+
+def _transfer_response(agent_name: str) -> LlmResponse:
+    return LlmResponse(
+        content=types.Content(
+            role="model",
+            parts=[
+                types.Part(
+                    function_call=types.FunctionCall(
+                        name=_TRANSFER_TOOL,
+                        args={"agent_name": agent_name},
+                    )
+                )
+            ],
+        )
+    )
+
+
+async def before_model_semantic_route(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """Transfer straight to a sub-agent when a similar message was routed before.
+
+    The embedding call runs in a worker thread so a lookup never blocks the
+    event loop (and every other session on it).
+    """
+    text = _latest_user_text(llm_request)
+    if text is None or _TRANSFER_TOOL not in llm_request.tools_dict:
+        return None
+
+    try:
+        embedding = await asyncio.to_thread(_embed, text)
+    except Exception as e:
+        logger.warning("Embedding failed, falling back to LLM: %s", e)
+        return None
+
+    agent_name = semantic_router.lookup(embedding)
+    if agent_name is not None:
+        return _transfer_response(agent_name)
+
+    callback_context.state[_EMBEDDING_STATE] = embedding
+    return None
+
+
+def after_model_record_route(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> Optional[LlmResponse]:
+    """Record the coordinator's transfer decision for the pending message."""
+    embedding = callback_context.state.get(_EMBEDDING_STATE)
+    if not embedding or llm_response.partial:
+        return None
+
+    callback_context.state[_EMBEDDING_STATE] = None
+    if not llm_response.content or not llm_response.content.parts:
+        return None
+    for part in llm_response.content.parts:
+        call = part.function_call
+        if call and call.name == _TRANSFER_TOOL and call.args:
+            agent_name = call.args.get("agent_name")
+            if agent_name:
+                semantic_router.add(embedding, agent_name)
+            break
+    return None
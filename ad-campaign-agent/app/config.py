@@ -22,14 +22,55 @@ import os
 # GOOGLE_CLOUD_LOCATION=global after Agent Engine setup.
 # See: app/agent_engine_app.py and https://github.com/google/adk-python/issues/3628
 MODEL = "gemini-3-flash-preview"  # Main agent model (requires global region)
+# Use a custom env var that Agent Engine doesn't override
+# GEMINI_MODEL_LOCATION is set in .env and passed via env_vars during deployment
+# Falls back to 'global' for Gemini 3 models
+GEMINI_MODEL_LOCATION = os.environ.get("GEMINI_MODEL_LOCATION", "global")
+# The coordinator only picks a sub-agent (or answers small talk), so it runs
+# on a smaller, cheaper model than the sub-agents doing the actual work.
+ROUTER_MODEL = "gemini-2.5-flash-lite"
 
 # Media generation models
 IMAGE_GENERATION = "gemini-3-pro-image-preview"  # For scene image generation (Stage 1)
 VEO_MODEL = "veo-3.1-generate-preview"  # For video animation (Stage 2)
 
+# Coordinator routing is deterministic (temperature 0), so identical requests
+# can be answered from an in-process cache instead of a fresh LLM call.
+COORDINATOR_TEMPERATURE = 0.0
+LLM_CACHE_TTL_SECONDS = 3600
+LLM_CACHE_MAX_ENTRIES = 256
+
+# Gemini context caching for the fixed instruction + tool declaration prefix.
+# Gemini 3 only caches prefixes of 4096+ tokens; the cache is refreshed every
+# CONTEXT_CACHE_INTERVALS invocations or when the TTL expires.
+CONTEXT_CACHE_MIN_TOKENS = 4096
+CONTEXT_CACHE_TTL_SECONDS = 3600
+CONTEXT_CACHE_INTERVALS = 10
+
+# Embeddings for semantic routing and tool retrieval
+EMBEDDING_MODEL = "gemini-embedding-001"
+EMBEDDING_DIMENSIONS = 256
+
+# Semantic routing: user messages that embed close to a previously routed
+# message are transferred to the same sub-agent without a coordinator call.
+ROUTER_SIMILARITY_THRESHOLD = 0.92
+ROUTER_MAX_ENTRIES = 512
+# Routing decisions expire so instruction or sub-agent changes take effect
+ROUTER_TTL_SECONDS = 3600
+
+# Tool retrieval (RetrievalToolset): an agent exposes its core tools plus the
+# TOOL_RETRIEVAL_TOP_K others most similar to the user's message. Not used by
+# agents under context caching, where a changing tool list defeats the cache.
+TOOL_RETRIEVAL_TOP_K = 3
+
 # Video configuration
 VIDEO_ASPECT_RATIO = "9:16"  # Vertical format for retail displays
 VIDEO_DURATION_SECONDS = 8  # Default video duration (4, 6, or 8 for Veo 3.1)
+VIDEO_BATCH_MAX_CONCURRENCY = 4  # Parallel generations per generate_video_batch call
+
+# The 22-product catalog is static demo data; lookups are served from memory
+# and re-read from SQLite after this many seconds.
+PRODUCT_CACHE_TTL_SECONDS = 300
 # API Keys (loaded from environment)
 GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
 # Support both GOOGLE_MAPS_API_KEY and MAPS_API_KEY (from .env)
@@ -48,6 +89,8 @@ IS_CLOUD_ENVIRONMENT = IS_CLOUD_RUN or IS_AGENT_ENGINE
 # This ensures consistent behavior between local development and Cloud Run
 DEFAULT_GCS_BUCKET = "kaggle-on-gcp-ad-campaign-assets"
 GCS_BUCKET = os.environ.get("GCS_BUCKET", DEFAULT_GCS_BUCKET)
+# How long a GCS seed image listing is reused before listing the bucket again
+STORAGE_LISTING_TTL_SECONDS = 300
 
 # GCS paths for assets
 GCS_PRODUCT_IMAGES_PREFIX = "product-images/"  # Renamed from seed-images per feedback
@@ -78,12 +121,23 @@ else:
     # Local development: use project root for persistence
     DB_PATH = os.path.join(PROJECT_DIR, "campaigns.db")
 
+# Tool embedding index persisted next to the database (a writable location
+# in every environment) so cold starts skip re-embedding tool docstrings
+TOOL_INDEX_PATH = os.path.join(os.path.dirname(DB_PATH), "tool_embeddings.json")
+
+# Startup warmup: prime the shared embedding client (auth + connection) and
+# precompute tool embeddings in a background thread on import. On by default
+# in managed cloud environments, where cold starts are user-visible.
+WARMUP_ON_START = os.environ.get(
+    "AGENT_WARMUP", "true" if IS_CLOUD_ENVIRONMENT else "false"
+).lower() == "true"
+
 # App metadata
 APP_NAME = "ad_campaign_agent"
 APP_DESCRIPTION = "Fashion retail ad campaign management agent with video generation"
 
-# Campaign categories
-CAMPAIGN_CATEGORIES = ["summer", "formal", "professional", "essentials"]
+# Campaign categories (must match the campaigns.category CHECK constraint)
+CAMPAIGN_CATEGORIES = frozenset({"summer", "formal", "professional", "essentials", "holiday"})
 
-# Campaign statuses
-CAMPAIGN_STATUSES = ["draft", "active", "paused", "completed"]
+# Campaign statuses (must match the campaigns.status CHECK constraint)
+CAMPAIGN_STATUSES = frozenset({"draft", "active", "paused", "completed"})
@@ -14,33 +14,425 @@
 
 """SQLite database setup and connection management."""
 
+import asyncio
+import atexit
 import sqlite3
+import sys
+import threading
+import time
 from contextlib import contextmanager
-from ..config import DB_PATH
+from contextvars import ContextVar
+from typing import Callable, Optional
+from ..config import DB_PATH, PRODUCT_CACHE_TTL_SECONDS
+
+# Bump whenever the schema or the seeded demo data changes. Stored in the
+# database header via PRAGMA user_version so warm starts can skip all DDL
+# and seeding work with a single metadata read.
+SCHEMA_VERSION = 4
+
+# Per-connection tuning. WAL lets tool reads run alongside writes from other
+# threads, NORMAL sync is durable enough for WAL, and mmap serves reads from
+# the page cache instead of read() syscalls. Pooled connections live for the
+# whole process, so each keeps a 20 MB page cache hot between tool calls.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+    # Wait for a competing writer instead of failing with "database is locked"
+    "PRAGMA busy_timeout=5000",
+)
+
+# Size of each connection's compiled-statement LRU (keyed by SQL text)
+STATEMENT_CACHE_SIZE = 256
+
+# One long-lived connection per thread (and DB path) for tool queries
+_local = threading.local()
+# Every pooled connection, so they can be closed (and the WAL checkpointed)
+# at interpreter exit
+_pooled_connections: list[sqlite3.Connection] = []
+_pooled_connections_lock = threading.Lock()
+
+# Cleared while a background bootstrap is creating and seeding the database.
+# Set by default so code that never starts a bootstrap is never blocked.
+_ready = threading.Event()
+_ready.set()
+_bootstrap_thread: Optional[threading.Thread] = None
+_bootstrap_error: Optional[BaseException] = None
+
+# (owner, connection, depth) of the innermost open get_db_cursor() block.
+# A ContextVar follows each asyncio task, so nesting is tracked per task
+# rather than per thread. Tasks and to_thread() calls inherit a copy, which
+# the owner check ignores.
+_open_cursor: ContextVar[Optional[tuple]] = ContextVar("open_cursor", default=None)
+
+# DB paths whose schema has been verified in this process
+_initialized_paths: set[str] = set()
+
+# Product catalog snapshots per DB path:
+# DB_PATH -> (expires_at, products ordered by name, by id, by name)
+_product_catalog: dict = {}
+_product_catalog_lock = threading.Lock()
+
+
+# Tables and indexes for columns that always exist. Columns added later are
+# handled by run_migrations()/create_migration_indexes().
+SCHEMA_SQL = '''
+BEGIN;
+
+-- Create campaigns table (product-centric: 1 campaign = 1 product + 1 store location)
+CREATE TABLE IF NOT EXISTS campaigns (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    description TEXT,
+    product_id INTEGER,
+    store_name TEXT,
+    city TEXT NOT NULL,
+    state TEXT NOT NULL,
+    category TEXT CHECK(category IN ('summer', 'formal', 'professional', 'essentials', 'holiday')),
+    status TEXT DEFAULT 'draft' CHECK(status IN ('draft', 'active', 'paused', 'completed')),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE SET NULL
+);
+
+-- Create products table (source of truth - 22 products)
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    category TEXT,
+    style TEXT,
+    color TEXT,
+    fabric TEXT,
+    details TEXT,
+    occasion TEXT,
+    image_filename TEXT NOT NULL,
+    gcs_path TEXT,
+    local_path TEXT,
+    metadata TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create campaign_products junction table
+CREATE TABLE IF NOT EXISTS campaign_products (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    campaign_id INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE,
+    FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE,
+    UNIQUE(campaign_id, product_id)
+);
+
+-- Create campaign_videos table (new video schema with HITL)
+CREATE TABLE IF NOT EXISTS campaign_videos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    campaign_id INTEGER NOT NULL,
+    product_id INTEGER,
+    video_filename TEXT NOT NULL UNIQUE,
+    gcs_path TEXT,
+    local_path TEXT,
+    thumbnail_path TEXT,
+    scene_prompt TEXT,
+    video_prompt TEXT,
+    pipeline_type TEXT DEFAULT 'two-stage',
+    variation_name TEXT,
+    variation_params TEXT,
+    duration_seconds INTEGER DEFAULT 8,
+    aspect_ratio TEXT DEFAULT '9:16',
+    status TEXT DEFAULT 'generated' CHECK(status IN ('generating', 'generated', 'activated', 'paused', 'archived')),
+    activated_at TIMESTAMP,
+    activated_by TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    generation_time_seconds INTEGER,
+    FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE,
+    FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE SET NULL
+);
+
+-- Create video_metrics table (only for activated videos)
+CREATE TABLE IF NOT EXISTS video_metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    video_id INTEGER NOT NULL,
+    metric_date DATE NOT NULL,
+    impressions INTEGER DEFAULT 0,
+    dwell_time_seconds REAL DEFAULT 0.0,
+    circulation INTEGER DEFAULT 0,
+    revenue REAL DEFAULT 0.0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (video_id) REFERENCES campaign_videos(id) ON DELETE CASCADE,
+    UNIQUE(video_id, metric_date)
+);
+
+-- Legacy tables for backward compatibility
+-- Create campaign_images table (legacy)
+CREATE TABLE IF NOT EXISTS campaign_images (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    campaign_id INTEGER NOT NULL,
+    image_path TEXT NOT NULL,
+    image_type TEXT DEFAULT 'seed' CHECK(image_type IN ('seed', 'reference')),
+    metadata TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE
+);
+
+-- Create campaign_ads table (legacy)
+CREATE TABLE IF NOT EXISTS campaign_ads (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    campaign_id INTEGER NOT NULL,
+    image_id INTEGER,
+    video_path TEXT NOT NULL,
+    prompt_used TEXT,
+    duration_seconds INTEGER DEFAULT 5,
+    status TEXT DEFAULT 'completed' CHECK(status IN ('pending', 'generating', 'completed', 'failed')),
+    video_properties TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE,
+    FOREIGN KEY (image_id) REFERENCES campaign_images(id) ON DELETE SET NULL
+);
+
+-- Create campaign_metrics table (legacy - In-Store Retail Media metrics)
+CREATE TABLE IF NOT EXISTS campaign_metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    campaign_id INTEGER NOT NULL,
+    ad_id INTEGER,
+    date DATE NOT NULL,
+    impressions INTEGER DEFAULT 0,
+    dwell_time REAL DEFAULT 0.0,
+    circulation INTEGER DEFAULT 0,
+    revenue REAL DEFAULT 0.0,
+    FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE,
+    FOREIGN KEY (ad_id) REFERENCES campaign_ads(id) ON DELETE SET NULL
+);
+
+-- Create base indexes (columns that always exist)
+CREATE INDEX IF NOT EXISTS idx_campaigns_status ON campaigns(status);
+CREATE INDEX IF NOT EXISTS idx_products_name ON products(name);
+CREATE INDEX IF NOT EXISTS idx_products_category ON products(category);
+CREATE INDEX IF NOT EXISTS idx_campaign_products_campaign ON campaign_products(campaign_id);
+CREATE INDEX IF NOT EXISTS idx_campaign_products_product ON campaign_products(product_id);
+-- (campaign_id, status) resolves the analytics join filter
+-- "cv.campaign_id = ? AND cv.status = 'activated'" from the index alone
+CREATE INDEX IF NOT EXISTS idx_campaign_videos_campaign_status ON campaign_videos(campaign_id, status);
+DROP INDEX IF EXISTS idx_campaign_videos_campaign;
+CREATE INDEX IF NOT EXISTS idx_campaign_videos_product ON campaign_videos(product_id);
+-- (status, created_at) serves the Review Agent's "pending videos, newest
+-- first" listing as an index range scan without a separate sort
+CREATE INDEX IF NOT EXISTS idx_campaign_videos_status_created ON campaign_videos(status, created_at DESC);
+DROP INDEX IF EXISTS idx_campaign_videos_status;
+CREATE INDEX IF NOT EXISTS idx_video_metrics_video ON video_metrics(video_id);
+CREATE INDEX IF NOT EXISTS idx_video_metrics_date ON video_metrics(metric_date);
+-- Legacy indexes
+CREATE INDEX IF NOT EXISTS idx_campaign_images_campaign ON campaign_images(campaign_id);
+CREATE INDEX IF NOT EXISTS idx_campaign_ads_campaign ON campaign_ads(campaign_id);
+-- (campaign_id, date) serves per-campaign date-range scans from the index
+CREATE INDEX IF NOT EXISTS idx_campaign_metrics_campaign_date ON campaign_metrics(campaign_id, date);
+DROP INDEX IF EXISTS idx_campaign_metrics_campaign;
+CREATE INDEX IF NOT EXISTS idx_campaign_metrics_date ON campaign_metrics(date);
+
+COMMIT;
+'''
+
+
+def _connect(check_same_thread: bool = True) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        DB_PATH,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        check_same_thread=check_same_thread,
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
 
 
 def get_connection() -> sqlite3.Connection:
-    """Get a database connection with row factory enabled."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    """Get a new database connection with row factory enabled.
+
+    The caller owns the connection and must close it. Tool code should use
+    get_db_cursor(), which reuses a pooled per-thread connection.
+    """
+    return _connect()
+
+
+def get_pooled_connection() -> sqlite3.Connection:
+    """Get this thread's long-lived connection, opening it on first use.
+
+    Connections are keyed by DB_PATH so pointing the module at another
+    database file never hands out a stale connection. Do not close it.
+    """
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    conn = connections.get(DB_PATH)
+    if conn is None:
+        # Only ever used by this thread; the flag just lets the exit hook
+        # close it from the main thread
+        conn = connections[DB_PATH] = _connect(check_same_thread=False)
+        with _pooled_connections_lock:
+            _pooled_connections.append(conn)
     return conn
 
 
+@atexit.register
+def _close_pooled_connections() -> None:
+    with _pooled_connections_lock:
+        while _pooled_connections:
+            try:
+                _pooled_connections.pop().close()
+            except sqlite3.Error:
+                pass
+
+
+def start_background_bootstrap(bootstrap: Callable[[], None]) -> threading.Thread:
+    """Run bootstrap (schema creation and seeding) on a daemon thread.
+
+    get_db_cursor() blocks until it finishes, so callers that never touch
+    the database are not held up by first-run seeding.
+    """
+    global _bootstrap_thread, _bootstrap_error
+
+    def _run():
+        global _bootstrap_error
+        try:
+            bootstrap()
+        except BaseException as e:
+            _bootstrap_error = e
+            print(f"[DB] Background initialization error: {e}", file=sys.stderr)
+            print(f"[DB] DB_PATH attempted: {DB_PATH}", file=sys.stderr)
+        finally:
+            _ready.set()
+
+    _bootstrap_error = None
+    _ready.clear()
+    _bootstrap_thread = threading.Thread(target=_run, name="db-bootstrap", daemon=True)
+    _bootstrap_thread.start()
+    return _bootstrap_thread
+
+
+def wait_until_ready(timeout: Optional[float] = None) -> None:
+    """Block until a running background bootstrap has finished.
+
+    Raises:
+        TimeoutError: If the bootstrap is still running after timeout seconds.
+        RuntimeError: If the bootstrap failed.
+    """
+    if threading.current_thread() is _bootstrap_thread:
+        return
+    if not _ready.wait(timeout):
+        raise TimeoutError("Database initialization is still running")
+    if _bootstrap_error is not None:
+        raise RuntimeError("Database initialization failed") from _bootstrap_error
+
+
+async def wait_until_ready_async(timeout: Optional[float] = None) -> None:
+    """wait_until_ready() for coroutines, without blocking the event loop.
+
+    Async tools should await this before their first get_db_cursor(), which
+    would otherwise block the loop (and every other session on it) while
+    background seeding runs.
+    """
+    if _ready.is_set():
+        wait_until_ready()
+    else:
+        await asyncio.to_thread(wait_until_ready, timeout)
+
+
+def _cursor_owner() -> object:
+    """The asyncio task running this code, or the thread outside of a task."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return task or threading.current_thread()
+
+
+def _event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 @contextmanager
 def get_db_cursor():
-    """Context manager for database operations."""
-    conn = get_connection()
+    """Context manager for database operations on the pooled connection.
+
+    Waits for a background bootstrap to finish before handing out a cursor.
+    A block nested in another one in the same task or thread shares its
+    connection, so only the outermost block commits or rolls back; a nested
+    block runs inside a SAVEPOINT and only undoes its own work on error.
+
+    On a thread running an event loop, each block opens (and closes) its own
+    connection instead. Do not await inside the block: an open write
+    transaction would hold the database lock across the await.
+    """
+    wait_until_ready()
+    owner = _cursor_owner()
+    enclosing = _open_cursor.get()
+    if enclosing is not None and enclosing[0] is owner:
+        # Nested inside a block of the same task or thread: share its
+        # connection and transaction
+        _, conn, depth = enclosing
+        dedicated = False
+    else:
+        # Coroutines all run on the event-loop thread and can interleave at
+        # any await, so they must not share that thread's pooled connection
+        # (or its open transaction). Each block on a loop thread gets its own
+        # connection.
+        depth = 0
+        dedicated = _event_loop_running()
+        conn = _connect() if dedicated else get_pooled_connection()
+    token = _open_cursor.set((owner, conn, depth + 1))
     cursor = conn.cursor()
     try:
+        if depth:
+            cursor.execute(f"SAVEPOINT cursor_{depth}")
         yield cursor
-        conn.commit()
+        if depth:
+            cursor.execute(f"RELEASE cursor_{depth}")
+        else:
+            conn.commit()
     except Exception as e:
-        conn.rollback()
+        if depth:
+            cursor.execute(f"ROLLBACK TO cursor_{depth}")
+            cursor.execute(f"RELEASE cursor_{depth}")
+        else:
+            conn.rollback()
         raise e
+    finally:
+        cursor.close()
+        _open_cursor.reset(token)
+        if dedicated:
+            conn.close()
+
+
+def get_schema_version() -> int:
+    """Return the schema version stamped in the database header (0 if new)."""
+    conn = get_connection()
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
     finally:
         conn.close()
 
 
+def set_schema_version(version: int = SCHEMA_VERSION) -> None:
+    """Stamp the database header with the given schema version."""
+    conn = get_connection()
+    try:
+        # PRAGMA does not accept bound parameters
+        conn.execute(f"PRAGMA user_version = {int(version)}")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def is_database_initialized() -> bool:
+    """Check whether the schema and demo data are already in place."""
+    return get_schema_version() >= SCHEMA_VERSION
+
+
 def init_database() -> None:
     """Initialize the database schema.
 
@@ -53,168 +445,20 @@ def init_database() -> None:
     - campaign_ads: Generated video ads (legacy alias)
     - video_metrics: Daily performance metrics (only for activated videos)
     - campaign_metrics: Daily performance metrics (legacy alias)
-    """
-    conn = get_connection()
-    cursor = conn.cursor()
 
-    # Create campaigns table (product-centric: 1 campaign = 1 product + 1 store location)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS campaigns (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            description TEXT,
-            product_id INTEGER,
-            store_name TEXT,
-            city TEXT NOT NULL,
-            state TEXT NOT NULL,
-            category TEXT CHECK(category IN ('summer', 'formal', 'professional', 'essentials', 'holiday')),
-            status TEXT DEFAULT 'draft' CHECK(status IN ('draft', 'active', 'paused', 'completed')),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE SET NULL
-        )
-    ''')
-
-    # Create products table (source of truth - 22 products)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS products (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL UNIQUE,
-            category TEXT,
-            style TEXT,
-            color TEXT,
-            fabric TEXT,
-            details TEXT,
-            occasion TEXT,
-            image_filename TEXT NOT NULL,
-            gcs_path TEXT,
-            local_path TEXT,
-            metadata TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-
-    # Create campaign_products junction table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS campaign_products (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            campaign_id INTEGER NOT NULL,
-            product_id INTEGER NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE,
-            FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE,
-            UNIQUE(campaign_id, product_id)
-        )
-    ''')
-
-    # Create campaign_videos table (new video schema with HITL)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS campaign_videos (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            campaign_id INTEGER NOT NULL,
-            product_id INTEGER,
-            video_filename TEXT NOT NULL UNIQUE,
-            gcs_path TEXT,
-            local_path TEXT,
-            thumbnail_path TEXT,
-            scene_prompt TEXT,
-            video_prompt TEXT,
-            pipeline_type TEXT DEFAULT 'two-stage',
-            variation_name TEXT,
-            variation_params TEXT,
-            duration_seconds INTEGER DEFAULT 8,
-            aspect_ratio TEXT DEFAULT '9:16',
-            status TEXT DEFAULT 'generated' CHECK(status IN ('generating', 'generated', 'activated', 'paused', 'archived')),
-            activated_at TIMESTAMP,
-            activated_by TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            generation_time_seconds INTEGER,
-            FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE,
-            FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE SET NULL
-        )
-    ''')
-
-    # Create video_metrics table (only for activated videos)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS video_metrics (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            video_id INTEGER NOT NULL,
-            metric_date DATE NOT NULL,
-            impressions INTEGER DEFAULT 0,
-            dwell_time_seconds REAL DEFAULT 0.0,
-            circulation INTEGER DEFAULT 0,
-            revenue REAL DEFAULT 0.0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (video_id) REFERENCES campaign_videos(id) ON DELETE CASCADE,
-            UNIQUE(video_id, metric_date)
-        )
-    ''')
-
-    # Legacy tables for backward compatibility
-    # Create campaign_images table (legacy)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS campaign_images (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            campaign_id INTEGER NOT NULL,
-            image_path TEXT NOT NULL,
-            image_type TEXT DEFAULT 'seed' CHECK(image_type IN ('seed', 'reference')),
-            metadata TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE
-        )
-    ''')
-
-    # Create campaign_ads table (legacy)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS campaign_ads (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            campaign_id INTEGER NOT NULL,
-            image_id INTEGER,
-            video_path TEXT NOT NULL,
-            prompt_used TEXT,
-            duration_seconds INTEGER DEFAULT 5,
-            status TEXT DEFAULT 'completed' CHECK(status IN ('pending', 'generating', 'completed', 'failed')),
-            video_properties TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE,
-            FOREIGN KEY (image_id) REFERENCES campaign_images(id) ON DELETE SET NULL
-        )
-    ''')
-
-    # Create campaign_metrics table (legacy - In-Store Retail Media metrics)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS campaign_metrics (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            campaign_id INTEGER NOT NULL,
-            ad_id INTEGER,
-            date DATE NOT NULL,
-            impressions INTEGER DEFAULT 0,
-            dwell_time REAL DEFAULT 0.0,
-            circulation INTEGER DEFAULT 0,
-            revenue REAL DEFAULT 0.0,
-            FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE,
-            FOREIGN KEY (ad_id) REFERENCES campaign_ads(id) ON DELETE SET NULL
-        )
-    ''')
-
-    # Create base indexes (columns that always exist)
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_campaigns_status ON campaigns(status)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_products_name ON products(name)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_products_category ON products(category)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_campaign_products_campaign ON campaign_products(campaign_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_campaign_products_product ON campaign_products(product_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_campaign_videos_campaign ON campaign_videos(campaign_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_campaign_videos_product ON campaign_videos(product_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_campaign_videos_status ON campaign_videos(status)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_video_metrics_video ON video_metrics(video_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_video_metrics_date ON video_metrics(metric_date)')
-    # Legacy indexes
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_campaign_images_campaign ON campaign_images(campaign_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_campaign_ads_campaign ON campaign_ads(campaign_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_campaign_metrics_campaign ON campaign_metrics(campaign_id)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_campaign_metrics_date ON campaign_metrics(date)')
+    Returns immediately once the schema has been verified in this process or
+    when PRAGMA user_version already shows the current SCHEMA_VERSION.
+    """
+    if DB_PATH in _initialized_paths:
+        return
+    if is_database_initialized():
+        _initialized_paths.add(DB_PATH)
+        return
 
-    conn.commit()
+    conn = get_connection()
+    # One executescript() call parses and runs the whole DDL batch (in its
+    # own BEGIN/COMMIT) instead of a Python round trip per statement
+    conn.executescript(SCHEMA_SQL)
     conn.close()
 
     # Run migrations for existing databases (adds new columns)
@@ -226,6 +470,8 @@ def init_database() -> None:
     # Populate products table
     populate_products()
 
+    _initialized_paths.add(DB_PATH)
+
 
 def create_migration_indexes() -> None:
     """Create indexes for columns added by migrations.
@@ -236,8 +482,7 @@ def create_migration_indexes() -> None:
     cursor = conn.cursor()
 
     # Check if product_id column exists before creating index
-    cursor.execute("PRAGMA table_info(campaigns)")
-    campaign_columns = [column[1] for column in cursor.fetchall()]
+    campaign_columns = _table_columns(cursor, ("campaigns",))["campaigns"]
 
     if "product_id" in campaign_columns:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_campaigns_product ON campaigns(product_id)')
@@ -248,62 +493,78 @@ def create_migration_indexes() -> None:
     conn.close()
 
 
+def _table_columns(cursor: sqlite3.Cursor, tables: tuple) -> dict[str, set[str]]:
+    """Return {table: column names} for the given tables in one query."""
+    placeholders = ", ".join("?" * len(tables))
+    cursor.execute(f'''
+        SELECT m.name, p.name
+        FROM sqlite_master m JOIN pragma_table_info(m.name) p
+        WHERE m.type = 'table' AND m.name IN ({placeholders})
+    ''', tables)
+    columns = {table: set() for table in tables}
+    for table, column in cursor.fetchall():
+        columns[table].add(column)
+    return columns
+
+
 def run_migrations() -> None:
     """Run database migrations for schema updates.
 
     This function handles adding new columns to existing databases.
-    It checks if columns exist before attempting to add them.
+    It reads every table's columns in one query, then applies every missing
+    column in a single transaction (one commit instead of one per ALTER TABLE).
     """
     conn = get_connection()
     cursor = conn.cursor()
 
-    # Migration 1: Add video_properties column to campaign_ads
-    cursor.execute("PRAGMA table_info(campaign_ads)")
-    columns = [column[1] for column in cursor.fetchall()]
-
-    if "video_properties" not in columns:
-        print("[DB Migration] Adding video_properties column to campaign_ads...")
-        cursor.execute("ALTER TABLE campaign_ads ADD COLUMN video_properties TEXT")
-        conn.commit()
-        print("[DB Migration] video_properties column added successfully.")
-
-    # Migration 2: Add product_id and store_name to campaigns (product-centric model)
-    cursor.execute("PRAGMA table_info(campaigns)")
-    campaign_columns = [column[1] for column in cursor.fetchall()]
-
-    if "product_id" not in campaign_columns:
-        print("[DB Migration] Adding product_id column to campaigns...")
-        cursor.execute("ALTER TABLE campaigns ADD COLUMN product_id INTEGER REFERENCES products(id)")
-        conn.commit()
-        print("[DB Migration] product_id column added successfully.")
-
-    if "store_name" not in campaign_columns:
-        print("[DB Migration] Adding store_name column to campaigns...")
-        cursor.execute("ALTER TABLE campaigns ADD COLUMN store_name TEXT")
-        conn.commit()
-        print("[DB Migration] store_name column added successfully.")
+    columns = _table_columns(cursor, ("campaign_ads", "campaigns", "campaign_metrics"))
+    ads_columns = columns["campaign_ads"]
+    campaign_columns = columns["campaigns"]
+    metrics_columns = columns["campaign_metrics"]
 
     # Migration 2: Check if campaign_metrics needs retail media migration
     # This checks if old columns exist - if so, run migrate_metrics_schema.py
-    cursor.execute("PRAGMA table_info(campaign_metrics)")
-    metrics_columns = [column[1] for column in cursor.fetchall()]
-
     if "views" in metrics_columns or "clicks" in metrics_columns:
         print("[DB Migration] WARNING: campaign_metrics has old digital video columns.")
         print("[DB Migration] Run: python -m scripts.migrate_metrics_schema")
         print("[DB Migration] to migrate to in-store retail media metrics.")
 
+    alterations = []
+
+    # Migration 1: Add video_properties column to campaign_ads
+    if "video_properties" not in ads_columns:
+        alterations.append(("video_properties", "campaign_ads",
+                            "ALTER TABLE campaign_ads ADD COLUMN video_properties TEXT"))
+
+    # Migration 2: Add product_id and store_name to campaigns (product-centric model)
+    if "product_id" not in campaign_columns:
+        alterations.append(("product_id", "campaigns",
+                            "ALTER TABLE campaigns ADD COLUMN product_id INTEGER REFERENCES products(id)"))
+    if "store_name" not in campaign_columns:
+        alterations.append(("store_name", "campaigns",
+                            "ALTER TABLE campaigns ADD COLUMN store_name TEXT"))
+
     # Check if new columns exist (for fresh databases or after migration)
     if "dwell_time" not in metrics_columns and "views" not in metrics_columns:
         # This is a fresh database with new schema - add columns
-        print("[DB Migration] Adding dwell_time column to campaign_metrics...")
-        cursor.execute("ALTER TABLE campaign_metrics ADD COLUMN dwell_time REAL DEFAULT 0.0")
-        print("[DB Migration] Adding circulation column to campaign_metrics...")
-        cursor.execute("ALTER TABLE campaign_metrics ADD COLUMN circulation INTEGER DEFAULT 0")
-        conn.commit()
-        print("[DB Migration] Retail media columns added successfully.")
+        alterations.append(("dwell_time", "campaign_metrics",
+                            "ALTER TABLE campaign_metrics ADD COLUMN dwell_time REAL DEFAULT 0.0"))
+        alterations.append(("circulation", "campaign_metrics",
+                            "ALTER TABLE campaign_metrics ADD COLUMN circulation INTEGER DEFAULT 0"))
 
-    conn.close()
+    try:
+        if alterations:
+            cursor.execute("BEGIN")
+            for column, table, statement in alterations:
+                print(f"[DB Migration] Adding {column} column to {table}...")
+                cursor.execute(statement)
+            conn.commit()
+            print(f"[DB Migration] {len(alterations)} column(s) added successfully.")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
 
 
 def reset_database() -> None:
@@ -322,10 +583,13 @@ def reset_database() -> None:
     cursor.execute('DROP TABLE IF EXISTS campaign_ads')
     cursor.execute('DROP TABLE IF EXISTS campaign_images')
     cursor.execute('DROP TABLE IF EXISTS campaigns')
+    cursor.execute('PRAGMA user_version = 0')
 
     conn.commit()
     conn.close()
 
+    _initialized_paths.discard(DB_PATH)
+    invalidate_product_cache()
     init_database()
 
 
@@ -341,20 +605,25 @@ def populate_products() -> None:
     conn = get_connection()
     cursor = conn.cursor()
 
-    # Check if products already exist
-    cursor.execute('SELECT COUNT(*) FROM products')
-    count = cursor.fetchone()[0]
-    if count > 0:
+    # Hold the write lock from the check through the commit (see
+    # populate_mock_data)
+    cursor.execute("BEGIN IMMEDIATE")
+
+    # Check if products already exist (stops at the first row)
+    cursor.execute('SELECT 1 FROM products LIMIT 1')
+    if cursor.fetchone():
+        conn.rollback()
         conn.close()
         return  # Products already populated
 
-    for product in PRODUCTS:
-        cursor.execute('''
-            INSERT OR IGNORE INTO products
-            (name, category, style, color, fabric, details, occasion,
-             image_filename, local_path, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    # One prepared statement and one commit for the whole catalog
+    cursor.executemany('''
+        INSERT OR IGNORE INTO products
+        (name, category, style, color, fabric, details, occasion,
+         image_filename, local_path, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', [
+        (
             product.get('name'),
             product.get('category'),
             product.get('style'),
@@ -365,13 +634,49 @@ def populate_products() -> None:
             product.get('image_filename'),
             product.get('local_path'),
             json.dumps(product)
-        ))
+        )
+        for product in PRODUCTS
+    ])
 
     conn.commit()
     conn.close()
+    invalidate_product_cache()
     print(f"[DB] Populated {len(PRODUCTS)} products")
 
 
+def invalidate_product_cache() -> None:
+    """Drop the cached product catalog after products are added or removed."""
+    with _product_catalog_lock:
+        _product_catalog.pop(DB_PATH, None)
+
+
+def _get_product_catalog() -> tuple:
+    """Return the (products, by_id, by_name) snapshot for DB_PATH.
+
+    The catalog is static demo data, so it is read once and then served from
+    memory for PRODUCT_CACHE_TTL_SECONDS. The cached dicts are never handed
+    out directly; callers get copies, so snapshots are safe to share across
+    threads.
+    """
+    with _product_catalog_lock:
+        entry = _product_catalog.get(DB_PATH)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1:]
+
+    with get_db_cursor() as cursor:
+        cursor.execute('SELECT * FROM products ORDER BY name')
+        # Read the column names once rather than via Row.keys() per row
+        columns = [column[0] for column in cursor.description]
+        products = tuple(dict(zip(columns, row)) for row in cursor.fetchall())
+    by_id = {p["id"]: p for p in products}
+    by_name = {p["name"]: p for p in products}
+
+    entry = (time.monotonic() + PRODUCT_CACHE_TTL_SECONDS, products, by_id, by_name)
+    with _product_catalog_lock:
+        _product_catalog[DB_PATH] = entry
+    return entry[1:]
+
+
 def get_product(product_id: int) -> dict:
     """Get a product by ID.
 
@@ -381,11 +686,8 @@ def get_product(product_id: int) -> dict:
     Returns:
         Product dictionary or None if not found
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM products WHERE id = ?', (product_id,))
-    row = cursor.fetchone()
-    conn.close()
+    _, by_id, _ = _get_product_catalog()
+    row = by_id.get(product_id)
 
     if row:
         return dict(row)
@@ -401,11 +703,8 @@ def get_product_by_name(name: str) -> dict:
     Returns:
         Product dictionary or None if not found
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM products WHERE name = ?', (name,))
-    row = cursor.fetchone()
-    conn.close()
+    _, _, by_name = _get_product_catalog()
+    row = by_name.get(name)
 
     if row:
         return dict(row)
@@ -421,15 +720,5 @@ def list_products(category: str = None) -> list:
     Returns:
         List of product dictionaries
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    if category:
-        cursor.execute('SELECT * FROM products WHERE category = ? ORDER BY name', (category,))
-    else:
-        cursor.execute('SELECT * FROM products ORDER BY name')
-
-    rows = cursor.fetchall()
-    conn.close()
-
-    return [dict(row) for row in rows]
+    products, _, _ = _get_product_catalog()
+    return [dict(row) for row in products if not category or row["category"] == category]
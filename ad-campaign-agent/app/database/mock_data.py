@@ -24,7 +24,7 @@ Uses NEW schema (product-centric model):
 import json
 import random
 from datetime import datetime, timedelta
-from .db import get_connection
+from .db import get_connection, invalidate_product_cache
 from .products_data import PRODUCTS
 
 
@@ -42,6 +42,7 @@ MOCK_CAMPAIGNS = [
         "state": "CA",
         "category": "summer",
         "status": "active",
+        "multiplier": 1.2,  # Los Angeles flagship store
     },
     {
         "product_name": "elegant-black-cocktail-dress",
@@ -50,6 +51,7 @@ MOCK_CAMPAIGNS = [
         "state": "NY",
         "category": "formal",
         "status": "active",
+        "multiplier": 0.9,  # NYC boutique
     },
     {
         "product_name": "black-high-waist-trousers",
@@ -58,6 +60,7 @@ MOCK_CAMPAIGNS = [
         "state": "IL",
         "category": "professional",
         "status": "active",
+        "multiplier": 1.0,  # Chicago baseline
     },
     {
         # Changed from emerald-satin-slip-dress (no real videos) to sage-satin-camisole
@@ -67,6 +70,7 @@ MOCK_CAMPAIGNS = [
         "state": "CA",
         "category": "essentials",  # 'casual' not in CHECK constraint; using 'essentials'
         "status": "active",
+        "multiplier": 0.7,  # Smaller market
     },
 ]
 
@@ -146,12 +150,12 @@ MOCK_VARIATIONS = [
 ]
 
 
+_PRODUCTS_BY_NAME = {product["name"]: product for product in PRODUCTS}
+
+
 def _get_product_by_name(product_name: str) -> dict:
     """Find a product by its hyphenated name."""
-    for product in PRODUCTS:
-        if product["name"] == product_name:
-            return product
-    return None
+    return _PRODUCTS_BY_NAME.get(product_name)
 
 
 def _generate_campaign_name(product_name: str, store_name: str) -> str:
@@ -165,7 +169,16 @@ def _generate_campaign_name(product_name: str, store_name: str) -> str:
     return f"{product_title} - {store_name}"
 
 
-def _generate_mock_video_metrics(video_id: int, campaign_id: int, days: int = 30) -> list:
+def _metric_days(days: int, today=None) -> list:
+    """Return (ISO date, is_weekend) for today and the preceding days."""
+    if today is None:
+        today = datetime.now().date()
+    dates = [today - timedelta(days=day_offset) for day_offset in range(days)]
+    return [(date.isoformat(), date.weekday() >= 5) for date in dates]
+
+
+def _generate_mock_video_metrics(video_id: int, multiplier: float = 1.0, days: int = 30,
+                                 metric_days: list = None) -> list:
     """Generate realistic in-store retail media metrics for an activated video.
 
     Metrics generated:
@@ -178,59 +191,41 @@ def _generate_mock_video_metrics(video_id: int, campaign_id: int, days: int = 30
 
     Args:
         video_id: The video ID in campaign_videos table
-        campaign_id: The campaign ID for location multiplier
+        multiplier: The campaign's store performance multiplier
         days: Number of days of metrics to generate
+        metric_days: Precomputed _metric_days(days), shared across videos
 
     Returns:
-        List of metric dictionaries
+        List of (video_id, metric_date, impressions, dwell_time_seconds,
+        circulation, revenue) tuples, ready for executemany
     """
-    metrics = []
-    today = datetime.now().date()
-
-    # Campaign-specific multipliers (some stores perform better)
-    campaign_multipliers = {
-        1: 1.2,   # Los Angeles flagship store
-        2: 0.9,   # NYC boutique
-        3: 1.0,   # Chicago baseline
-        4: 0.7,   # Smaller market
-    }
-    multiplier = campaign_multipliers.get(campaign_id, 1.0)
+    if metric_days is None:
+        metric_days = _metric_days(days)
+    uniform = random.uniform
 
     # Base metrics for in-store retail
     base_impressions = int(random.randint(800, 2000) * multiplier)
-    base_circulation = int(base_impressions * random.uniform(1.5, 2.5))
+    base_circulation = int(base_impressions * uniform(1.5, 2.5))
 
-    for day_offset in range(days):
-        date = today - timedelta(days=day_offset)
-
-        # Weekend patterns (more shoppers on weekends)
-        day_of_week = date.weekday()
-        weekend_boost = 1.4 if day_of_week >= 5 else 1.0
+    metrics = []
+    for metric_date, is_weekend in metric_days:
+        # Weekend patterns (more shoppers on weekends, who also browse longer)
+        if is_weekend:
+            weekend_boost, weekend_dwell_boost = 1.4, 1.2
+        else:
+            weekend_boost, weekend_dwell_boost = 1.0, 1.0
 
         # Daily variation
-        daily_variation = random.uniform(0.85, 1.15)
+        impressions = int(base_impressions * weekend_boost * uniform(0.85, 1.15))
+        circulation = int(base_circulation * weekend_boost * uniform(0.9, 1.1))
 
-        # Calculate metrics
-        impressions = int(base_impressions * weekend_boost * daily_variation)
-        circulation = int(base_circulation * weekend_boost * random.uniform(0.9, 1.1))
-
-        # Dwell time: 3-8 seconds, weekend shoppers browse longer
-        base_dwell = random.uniform(3.0, 8.0)
-        weekend_dwell_boost = 1.2 if day_of_week >= 5 else 1.0
-        dwell_time = round(min(base_dwell * weekend_dwell_boost, 12.0), 1)
+        # Dwell time: 3-8 seconds, capped at 12
+        dwell_time = round(min(uniform(3.0, 8.0) * weekend_dwell_boost, 12.0), 1)
 
         # Revenue: $0.02-$0.08 per impression for retail media
-        revenue_per_impression = random.uniform(0.02, 0.08) * multiplier
-        revenue = round(impressions * revenue_per_impression, 2)
-
-        metrics.append({
-            "video_id": video_id,
-            "metric_date": date.isoformat(),
-            "impressions": impressions,
-            "dwell_time_seconds": dwell_time,
-            "circulation": circulation,
-            "revenue": revenue
-        })
+        revenue = round(impressions * uniform(0.02, 0.08) * multiplier, 2)
+
+        metrics.append((video_id, metric_date, impressions, dwell_time, circulation, revenue))
 
     return metrics
 
@@ -250,28 +245,48 @@ def populate_mock_data() -> dict:
         Dictionary with counts of created records
     """
     conn = get_connection()
-    cursor = conn.cursor()
+    try:
+        cursor = conn.cursor()
+
+        # Take the write lock before the existence check so concurrent workers
+        # (Agent Engine runs several) can't both see an empty table and seed
+        # it. The whole load is then a single transaction with one commit.
+        cursor.execute("BEGIN IMMEDIATE")
+
+        # Check if data already exists (stops at the first row)
+        cursor.execute("SELECT 1 FROM campaigns LIMIT 1")
+        if cursor.fetchone():
+            conn.rollback()
+            return {"status": "skipped", "message": "Mock data already exists"}
+
+        # Commits on success and rolls back if any insert fails
+        with conn:
+            counts = _insert_mock_data(cursor)
+    finally:
+        conn.close()
 
-    # Check if data already exists - check BOTH old and new tables
-    cursor.execute("SELECT COUNT(*) FROM campaigns")
-    campaign_count = cursor.fetchone()[0]
+    invalidate_product_cache()
+    return {"status": "success", **counts}
 
-    if campaign_count > 0:
-        conn.close()
-        return {"status": "skipped", "message": "Mock data already exists"}
 
+def _insert_mock_data(cursor) -> dict:
+    """Insert products, campaigns, videos and metrics; return the counts."""
     products_created = 0
     campaigns_created = 0
     videos_created = 0
     metrics_created = 0
+    video_rows = []
+    campaign_multipliers = {}
+
+    # One clock read for every timestamp in this seed
+    now = datetime.now()
+    activated_at = now.isoformat()
+    date_str = now.strftime("%m%d%y")
 
     # Step 1: Insert all 22 products
     # Use INSERT OR IGNORE to handle multi-process race conditions (Agent Engine)
-    for product in PRODUCTS:
-        cursor.execute('''
-            INSERT OR IGNORE INTO products (name, category, style, color, fabric, details, occasion, image_filename, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    product_rows = [
+        (
             product["name"],
             product["category"],
             product.get("style", ""),
@@ -281,8 +296,20 @@ def populate_mock_data() -> dict:
             product.get("occasion", ""),
             product["image_filename"],
             json.dumps(product)
-        ))
-        products_created += 1
+        )
+        for product in PRODUCTS
+    ]
+    cursor.executemany('''
+        INSERT OR IGNORE INTO products (name, category, style, color, fabric, details, occasion, image_filename, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', product_rows)
+    # rowcount counts rows actually written, not ones INSERT OR IGNORE skipped
+    products_created = cursor.rowcount
+
+    # Resolve product ids once (rows may predate this run, so lastrowid
+    # can't be relied on with INSERT OR IGNORE)
+    cursor.execute("SELECT id, name FROM products")
+    product_ids = {name: product_id for product_id, name in cursor.fetchall()}
 
     # Step 2: Create product-centric campaigns
     for i, camp_data in enumerate(MOCK_CAMPAIGNS):
@@ -291,12 +318,9 @@ def populate_mock_data() -> dict:
         if not product:
             continue
 
-        # Get the product ID (1-indexed based on insertion order)
-        cursor.execute("SELECT id FROM products WHERE name = ?", (product["name"],))
-        product_row = cursor.fetchone()
-        if not product_row:
+        product_id = product_ids.get(product["name"])
+        if product_id is None:
             continue
-        product_id = product_row[0]
 
         # Generate campaign name
         campaign_name = _generate_campaign_name(product["name"], camp_data["store_name"])
@@ -317,15 +341,16 @@ def populate_mock_data() -> dict:
             camp_data["status"]
         ))
 
-        # Fetch the actual campaign_id (lastrowid is unreliable with INSERT OR IGNORE)
-        cursor.execute("SELECT id FROM campaigns WHERE name = ?", (campaign_name,))
-        campaign_row = cursor.fetchone()
-        if not campaign_row:
+        # Campaign names are not unique and the write lock taken above keeps
+        # other workers out, so lastrowid is this campaign's id whenever a
+        # row was actually written
+        if cursor.rowcount != 1:
             continue
-        campaign_id = campaign_row[0]
+        campaign_id = cursor.lastrowid
+        campaign_multipliers[campaign_id] = camp_data.get("multiplier", 1.0)
         campaigns_created += 1
 
-        # Step 3: Create activated videos using REAL GCS video files
+        # Step 3: Collect activated videos using REAL GCS video files
         if camp_data["status"] == "active":
             product_name = product["name"]
             real_video_list = REAL_VIDEOS.get(product_name, [])
@@ -334,26 +359,18 @@ def populate_mock_data() -> dict:
             if not real_video_list:
                 variation = MOCK_VARIATIONS[i % len(MOCK_VARIATIONS)]
                 variation_name = f"{variation['model_ethnicity']}-{variation['setting']}-{variation['time_of_day']}"
-                date_str = datetime.now().strftime("%m%d%y")
                 real_video_list = [{
                     "filename": f"{product_name}-{date_str}-{variation_name}.mp4",
                     "thumbnail": f"{product_name}-{date_str}-{variation_name}-thumbnail.png",
                     "variation": variation,
                 }]
 
-            # Insert ALL real videos for this campaign
+            # Queue ALL real videos for this campaign
             for video_data in real_video_list:
                 variation = video_data["variation"]
                 variation_name = f"{variation['model_ethnicity']}-{variation['setting']}-{variation['mood']}"
 
-                cursor.execute('''
-                    INSERT OR IGNORE INTO campaign_videos
-                    (campaign_id, product_id, video_filename, thumbnail_path,
-                     scene_prompt, video_prompt, pipeline_type,
-                     variation_name, variation_params, duration_seconds, aspect_ratio,
-                     status, activated_at, activated_by)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                video_rows.append((
                     campaign_id,
                     product_id,
                     video_data["filename"],
@@ -366,41 +383,49 @@ def populate_mock_data() -> dict:
                     8,
                     "9:16",
                     "activated",  # Pre-activated for demo
-                    datetime.now().isoformat(),
+                    activated_at,
                     "mock_data"
                 ))
 
-                # Fetch the actual video_id (lastrowid is unreliable with INSERT OR IGNORE)
-                cursor.execute("SELECT id FROM campaign_videos WHERE video_filename = ?",
-                              (video_data["filename"],))
-                video_row = cursor.fetchone()
-                if not video_row:
-                    continue
-                video_id = video_row[0]
-                videos_created += 1
-
-                # Step 4: Generate metrics for each activated video
-                metrics = _generate_mock_video_metrics(video_id, campaign_id, days=30)
-                for metric in metrics:
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO video_metrics
-                        (video_id, metric_date, impressions, dwell_time_seconds, circulation, revenue)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (
-                        metric["video_id"],
-                        metric["metric_date"],
-                        metric["impressions"],
-                        metric["dwell_time_seconds"],
-                        metric["circulation"],
-                        metric["revenue"]
-                    ))
-                    metrics_created += 1
-
-    conn.commit()
-    conn.close()
+    # Insert every video in one batch, then fetch the actual ids in one query
+    # (lastrowid is unreliable with INSERT OR IGNORE)
+    if video_rows:
+        cursor.executemany('''
+            INSERT OR IGNORE INTO campaign_videos
+            (campaign_id, product_id, video_filename, thumbnail_path,
+             scene_prompt, video_prompt, pipeline_type,
+             variation_name, variation_params, duration_seconds, aspect_ratio,
+             status, activated_at, activated_by)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', video_rows)
+        videos_created = cursor.rowcount
+
+        filenames = [row[2] for row in video_rows]
+        placeholders = ", ".join("?" * len(filenames))
+        cursor.execute(
+            f"SELECT id, campaign_id FROM campaign_videos WHERE video_filename IN ({placeholders})",
+            filenames,
+        )
+        videos = cursor.fetchall()
+
+        # Step 4: Generate metrics for each activated video (all videos
+        # share the same 30 dates)
+        metric_days = _metric_days(30, now.date())
+        metrics = [
+            metric
+            for video_id, campaign_id in videos
+            for metric in _generate_mock_video_metrics(
+                video_id, campaign_multipliers.get(campaign_id, 1.0),
+                metric_days=metric_days)
+        ]
+        cursor.executemany('''
+            INSERT OR IGNORE INTO video_metrics
+            (video_id, metric_date, impressions, dwell_time_seconds, circulation, revenue)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', metrics)
+        metrics_created = cursor.rowcount
 
     return {
-        "status": "success",
         "products_created": products_created,
         "campaigns_created": campaigns_created,
         "videos_created": videos_created,
@@ -0,0 +1,61 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Text embedding helpers shared by routing and tool retrieval.
+
+Vectors are returned normalized to unit length so cosine similarity is a
+plain dot product.
+"""
+
+import math
+from typing import Optional
+
+from google import genai
+from google.genai import types
+
+from .config import EMBEDDING_DIMENSIONS, EMBEDDING_MODEL
+
+_client: Optional[genai.Client] = None
+
+
+def _get_client() -> genai.Client:
+    """Get or create the embedding client (lazy initialization)."""
+    global _client
+    if _client is None:
+        _client = genai.Client()
+    return _client
+
+
+def normalize(vector: list[float]) -> list[float]:
+    """Scale a vector to unit length."""
+    norm = math.sqrt(sum(v * v for v in vector))
+    return [v / norm for v in vector] if norm else list(vector)
+
+
+def cosine(a: list[float], b: list[float]) -> float:
+    """Cosine similarity of two unit vectors."""
+    return sum(x * y for x, y in zip(a, b))
+
+
+def embed_text(text: str, task_type: str = "SEMANTIC_SIMILARITY") -> list[float]:
+    """Embed a single text as a unit vector."""
+    response = _get_client().models.embed_content(
+        model=EMBEDDING_MODEL,
+        contents=text,
+        config=types.EmbedContentConfig(
+            task_type=task_type,
+            output_dimensionality=EMBEDDING_DIMENSIONS,
+        ),
+    )
+    return normalize(list(response.embeddings[0].values))
@@ -30,12 +30,19 @@ Mode Detection:
 
 import io
 import os
+import threading
+import time
 from typing import Optional
 
 # Lazy GCS initialization to avoid import errors when running locally
 _gcs_client = None
 _bucket = None
 
+# Seed image listing cache: (validator, filenames). The validator is the
+# directory mtime in local mode and an expiry timestamp in GCS mode.
+_seed_images_cache: Optional[tuple] = None
+_seed_images_lock = threading.Lock()
+
 
 def _get_bucket():
     """Get GCS bucket (lazy initialization).
@@ -69,20 +76,46 @@ def get_storage_mode() -> str:
 def list_seed_images() -> list[str]:
     """List available seed image filenames.
 
+    The listing is cached in memory. Local listings are revalidated against
+    the directory mtime; GCS listings expire after STORAGE_LISTING_TTL_SECONDS
+    and are dropped whenever save_image() uploads a new image.
+
     Returns:
         List of image filenames (without path prefix).
     """
-    from .config import SELECTED_DIR
+    global _seed_images_cache
+    from .config import SELECTED_DIR, STORAGE_LISTING_TTL_SECONDS
     if get_storage_mode() == "gcs":
-        bucket = _get_bucket()
-        blobs = bucket.list_blobs(prefix="seed-images/")
-        return [b.name.replace("seed-images/", "")
-                for b in blobs if not b.name.endswith("/")]
+        with _seed_images_lock:
+            cached = _seed_images_cache
+            if cached is not None and cached[0] > time.monotonic():
+                return list(cached[1])
+            bucket = _get_bucket()
+            blobs = bucket.list_blobs(prefix="seed-images/")
+            images = [b.name.replace("seed-images/", "")
+                      for b in blobs if not b.name.endswith("/")]
+            _seed_images_cache = (time.monotonic() + STORAGE_LISTING_TTL_SECONDS, images)
+            return list(images)
     else:
-        if not os.path.exists(SELECTED_DIR):
+        try:
+            mtime = os.stat(SELECTED_DIR).st_mtime_ns
+        except FileNotFoundError:
             return []
-        return [f for f in os.listdir(SELECTED_DIR)
-                if f.endswith(('.jpg', '.jpeg', '.png'))]
+        validator = (SELECTED_DIR, mtime)
+        with _seed_images_lock:
+            cached = _seed_images_cache
+            if cached is not None and cached[0] == validator:
+                return list(cached[1])
+            images = [f for f in os.listdir(SELECTED_DIR)
+                      if f.endswith(('.jpg', '.jpeg', '.png'))]
+            _seed_images_cache = (validator, images)
+            return list(images)
+
+
+def _invalidate_seed_images() -> None:
+    global _seed_images_cache
+    with _seed_images_lock:
+        _seed_images_cache = None
 
 
 def image_exists(filename: str) -> bool:
@@ -143,6 +176,7 @@ def save_image(filename: str, data: bytes) -> str:
         blob = bucket.blob(f"seed-images/{filename}")
         # Use upload_from_file with BytesIO (documented API)
         blob.upload_from_file(io.BytesIO(data), content_type="image/png", rewind=True)
+        _invalidate_seed_images()
         return f"gs://{GCS_BUCKET}/seed-images/{filename}"
     else:
         os.makedirs(SELECTED_DIR, exist_ok=True)
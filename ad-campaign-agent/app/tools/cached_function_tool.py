@@ -0,0 +1,43 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""FunctionTool that builds its function declaration only once.
+
+ADK derives each tool's FunctionDeclaration from the Python signature and
+type hints (inspect + pydantic) when preparing every LLM request. With ~35
+tools across the agents that work repeats on every turn even though the
+result never changes for a given function. CachedFunctionTool builds the
+declaration on first use and hands out copies afterwards.
+"""
+
+from typing import Optional
+
+from google.adk.tools import FunctionTool
+from google.genai import types
+
+
+class CachedFunctionTool(FunctionTool):
+    """FunctionTool with a memoized declaration."""
+
+    def __init__(self, func, **kwargs):
+        super().__init__(func, **kwargs)
+        self._cached_declaration: Optional[types.FunctionDeclaration] = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+        if self._cached_declaration is None:
+            self._cached_declaration = super()._get_declaration()
+        if self._cached_declaration is None:
+            return None
+        # Callers (e.g. toolset prefixing) may mutate the declaration
+        return self._cached_declaration.model_copy(deep=True)
@@ -26,6 +26,7 @@ Product-Centric Model:
 
 import json
 from typing import Optional
+from ..config import CAMPAIGN_STATUSES
 from ..database.db import get_db_cursor, get_product
 
 
@@ -310,13 +311,11 @@ def update_campaign(
         Dictionary with updated campaign details or error message
     """
     # Validate status if provided
-    if status:
-        valid_statuses = ["draft", "active", "paused", "completed"]
-        if status not in valid_statuses:
-            return {
-                "status": "error",
-                "message": f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
-            }
+    if status and status not in CAMPAIGN_STATUSES:
+        return {
+            "status": "error",
+            "message": f"Invalid status. Must be one of: {', '.join(sorted(CAMPAIGN_STATUSES))}"
+        }
 
     with get_db_cursor() as cursor:
         # Check if campaign exists
@@ -0,0 +1,56 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run synchronous tools off the event loop so parallel calls overlap.
+
+When the model issues several function calls in one turn, ADK dispatches
+them together with asyncio.gather. Plain ``def`` tools still execute on the
+event loop, one after another, so independent DB reads or Gemini/Veo calls
+add up instead of overlapping. Wrapping them as coroutines that run the
+original function in a worker thread lets them run concurrently.
+
+Database access goes through one pooled SQLite connection per thread (see
+get_pooled_connection in database/db.py), so each worker thread uses its own
+connection and running tools there is safe; WAL mode lets their reads
+proceed alongside a writer.
+"""
+
+import asyncio
+import functools
+import inspect
+from typing import Callable
+
+from .cached_function_tool import CachedFunctionTool
+
+
+def run_in_thread(func: Callable) -> Callable:
+    """Wrap a synchronous tool as a coroutine executed via asyncio.to_thread.
+
+    functools.wraps keeps the name, docstring and signature (via __wrapped__),
+    so ADK builds the same function declaration and still injects
+    tool_context when the tool asks for it.
+    """
+    if inspect.iscoroutinefunction(func):
+        return func
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return wrapper
+
+
+def parallel_tools(tools: list) -> list[CachedFunctionTool]:
+    """Wrap functions as tools, offloading every synchronous one to a thread."""
+    return [CachedFunctionTool(run_in_thread(tool)) for tool in tools]
@@ -14,6 +14,8 @@
 
 """Google Maps tools for campaign location visualization."""
 
+import functools
+import importlib.util
 import json
 import os
 import time
@@ -24,7 +26,39 @@ from google.genai import types
 from google.adk.tools import ToolContext
 
 from ..config import GOOGLE_MAPS_API_KEY, IMAGE_GENERATION, GCS_BUCKET
-from ..database.db import get_db_cursor
+from ..database.db import get_db_cursor, wait_until_ready_async
+
+# One googlemaps client per process. It holds a requests.Session, so repeat
+# calls reuse the pooled HTTPS connection instead of a fresh TLS handshake.
+_gmaps_client = None
+
+
+def _get_gmaps_client():
+    """Return the shared googlemaps client."""
+    global _gmaps_client
+    if _gmaps_client is None:
+        import googlemaps
+        _gmaps_client = googlemaps.Client(key=GOOGLE_MAPS_API_KEY)
+    return _gmaps_client
+
+
+def _googlemaps_installed() -> bool:
+    """Whether the optional googlemaps package can be imported."""
+    return importlib.util.find_spec("googlemaps") is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _geocode(location: str) -> Optional[tuple]:
+    """Geocode "City, ST" to (lat, lng), or None if the location is unknown.
+
+    Store locations don't move, so results are cached for the life of the
+    process. Errors propagate and are not cached.
+    """
+    geocode_result = _get_gmaps_client().geocode(location)
+    if not geocode_result:
+        return None
+    coords = geocode_result[0]['geometry']['location']
+    return coords['lat'], coords['lng']
 
 
 def get_campaign_locations() -> dict:
@@ -36,9 +70,7 @@ def get_campaign_locations() -> dict:
     Returns:
         Dictionary with campaign locations and coordinates
     """
-    try:
-        import googlemaps
-    except ImportError:
+    if not _googlemaps_installed():
         return {
             "status": "error",
             "message": "googlemaps package not installed. Run: pip install googlemaps"
@@ -51,8 +83,6 @@ def get_campaign_locations() -> dict:
             "message": "GOOGLE_MAPS_API_KEY environment variable not set"
         }
 
-    gmaps = googlemaps.Client(key=api_key)
-
     with get_db_cursor() as cursor:
         cursor.execute('''
             SELECT
@@ -74,25 +104,16 @@ def get_campaign_locations() -> dict:
         campaigns = cursor.fetchall()
 
     locations = []
-    geocode_cache = {}
 
     for campaign in campaigns:
         location_key = f"{campaign['city']}, {campaign['state']}"
 
-        # Use cache to avoid duplicate geocoding
-        if location_key not in geocode_cache:
-            try:
-                geocode_result = gmaps.geocode(location_key)
-                if geocode_result:
-                    lat = geocode_result[0]['geometry']['location']['lat']
-                    lng = geocode_result[0]['geometry']['location']['lng']
-                    geocode_cache[location_key] = {"lat": lat, "lng": lng}
-                else:
-                    geocode_cache[location_key] = None
-            except Exception as e:
-                geocode_cache[location_key] = None
-
-        coords = geocode_cache.get(location_key)
+        # _geocode caches across calls, so each city is looked up once
+        try:
+            lat_lng = _geocode(location_key)
+        except Exception:
+            lat_lng = None
+        coords = {"lat": lat_lng[0], "lng": lat_lng[1]} if lat_lng else None
 
         locations.append({
             "campaign_id": campaign["id"],
@@ -157,9 +178,7 @@ def search_nearby_stores(
     Returns:
         Dictionary with nearby places
     """
-    try:
-        import googlemaps
-    except ImportError:
+    if not _googlemaps_installed():
         return {
             "status": "error",
             "message": "googlemaps package not installed. Run: pip install googlemaps"
@@ -172,24 +191,21 @@ def search_nearby_stores(
             "message": "GOOGLE_MAPS_API_KEY environment variable not set"
         }
 
-    gmaps = googlemaps.Client(key=api_key)
-
     try:
         # Geocode the location first
         location_str = f"{city}, {state}"
-        geocode_result = gmaps.geocode(location_str)
+        lat_lng = _geocode(location_str)
 
-        if not geocode_result:
+        if not lat_lng:
             return {
                 "status": "error",
                 "message": f"Could not geocode location: {location_str}"
             }
 
-        lat = geocode_result[0]['geometry']['location']['lat']
-        lng = geocode_result[0]['geometry']['location']['lng']
+        lat, lng = lat_lng
 
         # Search for nearby places
-        places_result = gmaps.places_nearby(
+        places_result = _get_gmaps_client().places_nearby(
             location=(lat, lng),
             radius=radius_meters,
             keyword=business_type
@@ -883,6 +899,7 @@ async def generate_map_visualization(
     Returns:
         Dictionary with visualization details and artifact info
     """
+    await wait_until_ready_async()
     print(f"[DEBUG MAP VIZ] Starting generate_map_visualization")
     print(f"[DEBUG MAP VIZ] visualization_type={visualization_type}, metric={metric}, style={style}")
 
@@ -22,7 +22,7 @@ from google import genai
 from google.genai import types
 from google.adk.tools import ToolContext
 
-from ..database.db import get_db_cursor
+from ..database.db import get_db_cursor, wait_until_ready_async
 from ..config import IMAGE_GENERATION
 
 
@@ -201,7 +201,8 @@ def get_campaign_metrics(campaign_id: int, days: int = 30) -> dict:
                 SUM(vm.impressions) as impressions,
                 AVG(vm.dwell_time_seconds) as avg_dwell_time,
                 SUM(vm.circulation) as circulation,
-                SUM(vm.revenue) as revenue
+                SUM(vm.revenue) as revenue,
+                SUM(vm.revenue) * 1.0 / NULLIF(SUM(vm.impressions), 0) as rpi
             FROM video_metrics vm
             JOIN campaign_videos cv ON vm.video_id = cv.id
             WHERE cv.campaign_id = ?
@@ -214,9 +215,8 @@ def get_campaign_metrics(campaign_id: int, days: int = 30) -> dict:
         daily_metrics = []
         for row in cursor.fetchall():
             impressions = int(row["impressions"]) if row["impressions"] else 0
-            revenue = round(row["revenue"], 2) if row["revenue"] else 0
-            # Compute RPI on the fly (THE key metric)
-            rpi = round(revenue / impressions, 4) if impressions > 0 else 0
+            # RPI (THE key metric) is computed in the query
+            rpi = round(row["rpi"], 4) if row["rpi"] else 0
 
             daily_metrics.append({
                 "date": row["date"],
@@ -232,7 +232,8 @@ def get_campaign_metrics(campaign_id: int, days: int = 30) -> dict:
                 SUM(vm.impressions) as total_impressions,
                 AVG(vm.dwell_time_seconds) as avg_dwell_time,
                 SUM(vm.circulation) as total_circulation,
-                SUM(vm.revenue) as total_revenue
+                SUM(vm.revenue) as total_revenue,
+                SUM(vm.revenue) * 1.0 / NULLIF(SUM(vm.impressions), 0) as rpi
             FROM video_metrics vm
             JOIN campaign_videos cv ON vm.video_id = cv.id
             WHERE cv.campaign_id = ?
@@ -246,8 +247,8 @@ def get_campaign_metrics(campaign_id: int, days: int = 30) -> dict:
         if totals and totals["total_impressions"]:
             total_impressions = int(totals["total_impressions"])
             total_revenue = round(totals["total_revenue"], 2) if totals["total_revenue"] else 0
-            # RPI is THE key metric for retail media
-            rpi = round(total_revenue / total_impressions, 4) if total_impressions > 0 else 0
+            # RPI is THE key metric for retail media (computed in the query)
+            rpi = round(totals["rpi"], 4) if totals["rpi"] else 0
 
             summary = {
                 "total_impressions": total_impressions,
@@ -332,7 +333,8 @@ def get_top_performing_ads(metric: str = "revenue_per_impression", limit: int =
                 SUM(vm.impressions) as total_impressions,
                 AVG(vm.dwell_time_seconds) as avg_dwell_time,
                 SUM(vm.circulation) as total_circulation,
-                SUM(vm.revenue) as total_revenue
+                SUM(vm.revenue) as total_revenue,
+                SUM(vm.revenue) * 1.0 / NULLIF(SUM(vm.impressions), 0) as rpi
             FROM campaign_videos cv
             JOIN campaigns c ON cv.campaign_id = c.id
             LEFT JOIN products p ON cv.product_id = p.id
@@ -349,9 +351,7 @@ def get_top_performing_ads(metric: str = "revenue_per_impression", limit: int =
             # Parse variation_params for characteristics
             variation_params = json.loads(row["variation_params"]) if row["variation_params"] else {}
             total_impressions = int(row["total_impressions"]) if row["total_impressions"] else 0
-            total_revenue = round(row["total_revenue"], 2) if row["total_revenue"] else 0
-            # Compute RPI
-            rpi = round(total_revenue / total_impressions, 4) if total_impressions > 0 else 0
+            rpi = round(row["rpi"], 4) if row["rpi"] else 0
 
             top_ads.append({
                 "rank": len(top_ads) + 1,
@@ -644,7 +644,8 @@ def compare_campaigns(campaign_ids: List[int]) -> dict:
                     SUM(vm.impressions) as total_impressions,
                     AVG(vm.dwell_time_seconds) as avg_dwell_time,
                     SUM(vm.circulation) as total_circulation,
-                    SUM(vm.revenue) as total_revenue
+                    SUM(vm.revenue) as total_revenue,
+                    SUM(vm.revenue) * 1.0 / NULLIF(SUM(vm.impressions), 0) as rpi
                 FROM campaigns c
                 LEFT JOIN campaign_videos cv ON c.id = cv.campaign_id
                 LEFT JOIN video_metrics vm ON cv.id = vm.video_id AND cv.status = 'activated'
@@ -656,8 +657,7 @@ def compare_campaigns(campaign_ids: List[int]) -> dict:
             if row:
                 total_impressions = int(row["total_impressions"]) if row["total_impressions"] else 0
                 total_revenue = round(row["total_revenue"], 2) if row["total_revenue"] else 0
-                # Compute RPI on the fly
-                rpi = round(total_revenue / total_impressions, 4) if total_impressions > 0 else 0
+                rpi = round(row["rpi"], 4) if row["rpi"] else 0
 
                 comparisons.append({
                     "campaign_id": row["id"],
@@ -759,6 +759,7 @@ async def generate_metrics_visualization(
 
     # Get campaign metrics data
     print(f"[DEBUG VIZ] Step 1: Fetching metrics from database...")
+    await wait_until_ready_async()
     metrics_result = get_campaign_metrics(campaign_id, days)
     if metrics_result["status"] == "error":
         return metrics_result
@@ -474,13 +474,12 @@ def _generate_mock_video_metrics(
     Returns:
         Number of metric records created
     """
-    metrics_created = 0
-
     # Base performance (varies by video for diversity)
     base_impressions = random.randint(800, 1500)
     base_dwell = random.uniform(4.0, 6.5)
     base_rpi = random.uniform(0.08, 0.15)  # Revenue per impression
 
+    rows = []
     for day_offset in range(days):
         metric_date = start_date + timedelta(days=day_offset)
 
@@ -502,15 +501,16 @@ def _generate_mock_video_metrics(
         circulation = int(impressions * random.uniform(1.8, 2.5))  # More foot traffic than impressions
         revenue = round(impressions * base_rpi * random.uniform(0.9, 1.1), 2)
 
-        cursor.execute('''
-            INSERT OR IGNORE INTO video_metrics
-            (video_id, metric_date, impressions, dwell_time_seconds, circulation, revenue)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (video_id, metric_date.isoformat(), impressions, dwell_time, circulation, revenue))
+        rows.append((video_id, metric_date.isoformat(), impressions, dwell_time, circulation, revenue))
 
-        metrics_created += 1
+    # One executemany instead of a statement round trip per day
+    cursor.executemany('''
+        INSERT OR IGNORE INTO video_metrics
+        (video_id, metric_date, impressions, dwell_time_seconds, circulation, revenue)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', rows)
 
-    return metrics_created
+    return len(rows)
 
 
 def generate_additional_metrics(
@@ -0,0 +1,213 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-turn tool retrieval for agents with large toolsets.
+
+Every tool declaration is sent with every request. RetrievalToolset always
+exposes a small set of core tools and adds only the top_k remaining tools
+whose name/docstring embedding is closest to the user's message. Prefill
+shrinks accordingly.
+
+Only use it for agents outside Gemini context caching. Tool declarations
+are part of the cached prefix, so a declaration set that changes from turn
+to turn invalidates the cache; with caching on (as App does in agent.py) a
+fixed tool list is cheaper than retrieval.
+
+Only declarations are trimmed: the optional tools left out of a turn are
+still registered as callable, so a call the model makes to one of them
+(e.g. a tool it used earlier in the conversation) runs instead of failing
+with "Tool ... not found".
+
+Tool embeddings are persisted to a small JSON index so later cold starts
+only embed the user's message. If embeddings are unavailable the full
+toolset is returned, so retrieval can only ever reduce prompt size, never
+break a turn.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Union
+
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.tools import BaseTool
+from google.adk.tools.base_toolset import BaseToolset
+from google.adk.tools.tool_context import ToolContext
+
+from ..config import (
+    EMBEDDING_DIMENSIONS,
+    EMBEDDING_MODEL,
+    TOOL_INDEX_PATH,
+    TOOL_RETRIEVAL_TOP_K,
+)
+from ..embeddings import cosine, embed_text
+from .cached_function_tool import CachedFunctionTool
+
+# Recent user messages and their embeddings; get_tools runs on every model
+# call of a turn, but the user message only changes once per turn.
+_QUERY_CACHE_SIZE = 64
+
+
+def _as_tool(tool: Union[Callable, BaseTool]) -> BaseTool:
+    return tool if isinstance(tool, BaseTool) else CachedFunctionTool(tool)
+
+
+def _tool_text(tool: BaseTool) -> str:
+    return f"{tool.name}: {tool.description or ''}"
+
+
+def _text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _load_index(path: str) -> dict[str, list[float]]:
+    """Load persisted tool embeddings, ignoring files from another model."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("model") != EMBEDDING_MODEL or data.get("dimensions") != EMBEDDING_DIMENSIONS:
+        return {}
+    return data.get("embeddings", {})
+
+
+def _save_index(path: str, embeddings: dict[str, list[float]]) -> None:
+    """Atomically write the tool embeddings; failures only cost a re-embed."""
+    data = {
+        "model": EMBEDDING_MODEL,
+        "dimensions": EMBEDDING_DIMENSIONS,
+        "embeddings": embeddings,
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[RetrievalToolset] Could not persist tool index: {e}")
+
+
+class _UndeclaredTool(BaseTool):
+    """Keeps a trimmed tool callable without sending its declaration."""
+
+    def __init__(self, tool: BaseTool):
+        super().__init__(name=tool.name, description=tool.description)
+        self.tool = tool
+
+    async def process_llm_request(
+        self, *, tool_context: ToolContext, llm_request: LlmRequest
+    ) -> None:
+        # Function calls are dispatched through tools_dict, so registering the
+        # wrapped tool there is enough for it to run
+        llm_request.tools_dict.setdefault(self.name, self.tool)
+
+
+class RetrievalToolset(BaseToolset):
+    """Toolset that exposes core tools plus the most relevant optional ones.
+
+    Args:
+        core_tools: Tools (or plain functions) always offered to the model.
+        optional_tools: Tools ranked by similarity to the user message.
+        top_k: Number of optional tools to include per turn.
+        index_path: JSON file caching tool embeddings across processes,
+            keyed by a hash of each tool's text. None disables persistence.
+    """
+
+    def __init__(
+        self,
+        core_tools: list[Union[Callable, BaseTool]],
+        optional_tools: list[Union[Callable, BaseTool]],
+        top_k: int = TOOL_RETRIEVAL_TOP_K,
+        index_path: Optional[str] = TOOL_INDEX_PATH,
+    ):
+        super().__init__()
+        self.core_tools = [_as_tool(tool) for tool in core_tools]
+        self.optional_tools = [_as_tool(tool) for tool in optional_tools]
+        self.top_k = top_k
+        self._undeclared = {tool.name: _UndeclaredTool(tool) for tool in self.optional_tools}
+        self.index_path = index_path
+        self._tool_embeddings: Optional[list[list[float]]] = None
+        self._query_embeddings: "OrderedDict[str, list[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def all_tools(self) -> list[BaseTool]:
+        return self.core_tools + self.optional_tools
+
+    def _get_tool_embeddings(self) -> list[list[float]]:
+        """Embed the optional tools once, reusing the on-disk index if present."""
+        if self._tool_embeddings is None:
+            index = _load_index(self.index_path) if self.index_path else {}
+            keys = [_text_key(_tool_text(tool)) for tool in self.optional_tools]
+            missing = False
+            for key, tool in zip(keys, self.optional_tools):
+                if key not in index:
+                    index[key] = embed_text(_tool_text(tool), task_type="RETRIEVAL_DOCUMENT")
+                    missing = True
+            if missing and self.index_path:
+                _save_index(self.index_path, index)
+            self._tool_embeddings = [index[key] for key in keys]
+        return self._tool_embeddings
+
+    def warm_up(self) -> None:
+        """Precompute the tool embeddings so the first turn doesn't wait on them."""
+        self._get_tool_embeddings()
+
+    def _get_query_embedding(self, text: str) -> list[float]:
+        with self._lock:
+            if text in self._query_embeddings:
+                self._query_embeddings.move_to_end(text)
+                return self._query_embeddings[text]
+        embedding = embed_text(text, task_type="RETRIEVAL_QUERY")
+        with self._lock:
+            self._query_embeddings[text] = embedding
+            while len(self._query_embeddings) > _QUERY_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
+        return embedding
+
+    def select_tools(self, text: str) -> list[BaseTool]:
+        """Return core tools plus the top_k optional tools for this message."""
+        query = self._get_query_embedding(text)
+        scored = sorted(
+            zip(self._get_tool_embeddings(), self.optional_tools),
+            key=lambda pair: cosine(pair[0], query),
+            reverse=True,
+        )
+        return self.core_tools + [tool for _, tool in scored[: self.top_k]]
+
+    async def get_tools(
+        self, readonly_context: Optional[ReadonlyContext] = None
+    ) -> list[BaseTool]:
+        user_content = readonly_context.user_content if readonly_context else None
+        text = ""
+        if user_content and user_content.parts:
+            text = " ".join(p.text for p in user_content.parts if p.text).strip()
+        if not text or len(self.optional_tools) <= self.top_k:
+            return self.all_tools
+
+        try:
+            selected = await asyncio.to_thread(self.select_tools, text)
+        except Exception as e:
+            print(f"[RetrievalToolset] Tool retrieval failed, exposing all tools: {e}")
+            return self.all_tools
+
+        declared = {tool.name for tool in selected}
+        return selected + [
+            wrapper for name, wrapper in self._undeclared.items() if name not in declared
+        ]
@@ -31,6 +31,7 @@ HITL Workflow:
     - Use review_tools.activate_video() to push live
 """
 
+import asyncio
 import io
 import json
 import os
@@ -38,7 +39,6 @@ import time
 from datetime import datetime
 from typing import Optional, Dict, Any, Tuple
 
-from PIL import Image as PILImage
 from google import genai
 from google.genai import types
 from google.adk.tools import ToolContext
@@ -50,8 +50,14 @@ from ..config import (
     IMAGE_GENERATION,
     VEO_MODEL,
     VIDEO_DURATION_SECONDS,
+    VIDEO_BATCH_MAX_CONCURRENCY,
+)
+from ..database.db import (
+    get_db_cursor,
+    get_product,
+    get_product_by_name,
+    wait_until_ready_async,
 )
-from ..database.db import get_db_cursor, get_product, get_product_by_name
 from ..models.video_properties import VideoProperties
 from ..models.variation import CreativeVariation, get_default_variation, PRESET_VARIATIONS
 from .prompt_builders import build_scene_image_prompt, build_video_animation_prompt, build_creative_prompt
@@ -233,7 +239,7 @@ async def generate_scene_image(
                 "\n" + scene_prompt
             ]
 
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model=IMAGE_GENERATION,
             contents=contents,
             config=types.GenerateContentConfig(
@@ -295,7 +301,7 @@ async def animate_scene_with_veo(
 
     # Start video generation
     print(f"[DEBUG animate_scene_with_veo] Calling Veo ({VEO_MODEL})...")
-    operation = client.models.generate_videos(
+    operation = await client.aio.models.generate_videos(
         model=VEO_MODEL,
         prompt=video_prompt,
         image=image,
@@ -315,9 +321,9 @@ async def animate_scene_with_veo(
             raise TimeoutError(f"Video generation timed out after {max_wait_time} seconds")
 
         print(f"[DEBUG animate_scene_with_veo] Waiting... ({waited}s elapsed)")
-        time.sleep(poll_interval)
+        await asyncio.sleep(poll_interval)
         waited += poll_interval
-        operation = client.operations.get(operation)
+        operation = await client.aio.operations.get(operation)
 
     print(f"[DEBUG animate_scene_with_veo] Operation completed after {waited}s")
 
@@ -460,6 +466,7 @@ async def generate_video_from_product(
     Returns:
         Dictionary with video details and status='generated'
     """
+    await wait_until_ready_async()
     print(f"[DEBUG generate_video_from_product] Starting for campaign_id={campaign_id}, product_id={product_id}")
 
     # Ensure generated directory exists (only in local mode)
@@ -549,7 +556,9 @@ async def generate_video_from_product(
 
             # Save scene image as thumbnail
             if storage.get_storage_mode() == "gcs":
-                thumbnail_path = storage.save_video(thumbnail_filename, scene_image_bytes)
+                thumbnail_path = await asyncio.to_thread(
+                    storage.save_video, thumbnail_filename, scene_image_bytes
+                )
             else:
                 thumbnail_path = os.path.join(GENERATED_DIR, thumbnail_filename)
                 with open(thumbnail_path, 'wb') as f:
@@ -577,7 +586,7 @@ async def generate_video_from_product(
             image = types.Image(image_bytes=product_image_bytes, mime_type="image/png")
 
             client = genai.Client()
-            operation = client.models.generate_videos(
+            operation = await client.aio.models.generate_videos(
                 model=VEO_MODEL,
                 prompt=video_prompt,
                 image=image,
@@ -594,9 +603,9 @@ async def generate_video_from_product(
             while not operation.done:
                 if waited >= max_wait_time:
                     raise TimeoutError("Video generation timed out")
-                time.sleep(poll_interval)
+                await asyncio.sleep(poll_interval)
                 waited += poll_interval
-                operation = client.operations.get(operation)
+                operation = await client.aio.operations.get(operation)
 
             if operation.result is None or not operation.result.generated_videos:
                 raise ValueError("No video generated")
@@ -607,7 +616,7 @@ async def generate_video_from_product(
             if is_vertex_ai:
                 video_bytes = generated_video.video.video_bytes
             else:
-                client.files.download(file=generated_video.video)
+                await asyncio.to_thread(client.files.download, file=generated_video.video)
                 import tempfile
                 with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
                     temp_path = tmp.name
@@ -624,7 +633,9 @@ async def generate_video_from_product(
 
         # Save video
         if storage.get_storage_mode() == "gcs":
-            video_path = storage.save_video(video_filename, video_bytes)
+            video_path = await asyncio.to_thread(
+                storage.save_video, video_filename, video_bytes
+            )
         else:
             video_path = os.path.join(GENERATED_DIR, video_filename)
             with open(video_path, 'wb') as f:
@@ -632,7 +643,8 @@ async def generate_video_from_product(
         print(f"[DEBUG generate_video_from_product] Saved video: {video_path}")
 
         # Save metadata file
-        save_video_metadata(
+        await asyncio.to_thread(
+            save_video_metadata,
             video_filename=video_filename,
             product=product,
             variation=variation_obj,
@@ -835,6 +847,7 @@ async def generate_video_ad(
     Returns:
         Dictionary with video path and generation details
     """
+    await wait_until_ready_async()
     print(f"[DEBUG generate_video_ad] Starting for campaign_id={campaign_id}")
     print(f"[DEBUG generate_video_ad] image_id={image_id}, duration_seconds={duration_seconds}")
     print(f"[DEBUG generate_video_ad] custom_prompt={custom_prompt[:100] if custom_prompt else 'None'}...")
@@ -945,6 +958,8 @@ async def generate_video_ad(
         print(f"[DEBUG generate_video_ad] Image bytes size: {len(image_bytes)}")
 
         # Use PIL to determine format and re-encode if needed
+        # (imported here so agent startup doesn't pay for PIL)
+        from PIL import Image as PILImage
         with PILImage.open(io.BytesIO(image_bytes)) as im:
             print(f"[DEBUG generate_video_ad] Image format: {im.format}, size: {im.size}")
             img_format = im.format or "JPEG"
@@ -1264,6 +1279,7 @@ async def apply_winning_formula(
             characteristics_to_apply=["mood", "setting"]
         )
     """
+    await wait_until_ready_async()
     print(f"[DEBUG apply_winning_formula] Starting...")
     print(f"[DEBUG apply_winning_formula] target_campaign_id={target_campaign_id}")
     print(f"[DEBUG apply_winning_formula] source_ad_id={source_ad_id}")
@@ -1606,6 +1622,7 @@ async def generate_video_with_properties(
     Returns:
         Dictionary with video details and extracted properties
     """
+    await wait_until_ready_async()
     print(f"[DEBUG generate_video_with_properties] Starting for campaign_id={campaign_id}")
 
     # Build property overrides from parameters
@@ -1682,6 +1699,7 @@ async def get_video_properties(ad_id: int) -> dict:
     Returns:
         Dictionary with video properties and ad details
     """
+    await wait_until_ready_async()
     with get_db_cursor() as cursor:
         cursor.execute('''
             SELECT ca.*, c.name as campaign_name
@@ -1691,40 +1709,42 @@ async def get_video_properties(ad_id: int) -> dict:
         ''', (ad_id,))
 
         ad = cursor.fetchone()
-        if not ad:
-            return {
-                "status": "error",
-                "message": f"Ad with ID {ad_id} not found"
-            }
-
-        video_props = None
-        if ad["video_properties"]:
-            try:
-                video_props = json.loads(ad["video_properties"])
-            except json.JSONDecodeError:
-                pass
+    if not ad:
+        return {
+            "status": "error",
+            "message": f"Ad with ID {ad_id} not found"
+        }
 
-        # If no properties exist, try to analyze the video
-        if not video_props and ad["video_path"] and ad["status"] == "completed":
-            video_filename = ad["video_path"]
-            # Use storage abstraction for existence check
-            if storage.video_exists(video_filename):
-                properties = await analyze_video(video_filename)
-                video_props = properties.model_dump()
-                # Save to database
+    video_props = None
+    if ad["video_properties"]:
+        try:
+            video_props = json.loads(ad["video_properties"])
+        except json.JSONDecodeError:
+            pass
+
+    # If no properties exist, try to analyze the video. Analysis runs
+    # outside the cursor block so no transaction stays open across the await.
+    if not video_props and ad["video_path"] and ad["status"] == "completed":
+        video_filename = ad["video_path"]
+        # Use storage abstraction for existence check
+        if storage.video_exists(video_filename):
+            properties = await analyze_video(video_filename)
+            video_props = properties.model_dump()
+            # Save to database
+            with get_db_cursor() as cursor:
                 cursor.execute('''
                     UPDATE campaign_ads SET video_properties = ? WHERE id = ?
                 ''', (properties.model_dump_json(), ad_id))
 
-        return {
-            "status": "success",
-            "ad_id": ad_id,
-            "campaign_id": ad["campaign_id"],
-            "campaign_name": ad["campaign_name"],
-            "video_path": ad["video_path"],
-            "video_properties": video_props,
-            "has_properties": video_props is not None
-        }
+    return {
+        "status": "success",
+        "ad_id": ad_id,
+        "campaign_id": ad["campaign_id"],
+        "campaign_name": ad["campaign_name"],
+        "video_path": ad["video_path"],
+        "video_properties": video_props,
+        "has_properties": video_props is not None
+    }
 
 
 # =============================================================================
@@ -1920,6 +1940,77 @@ async def generate_video_with_variation(
     )
 
 
+async def generate_video_batch(
+    campaign_id: int,
+    product_id: int,
+    variations: list[dict],
+    duration_seconds: int = 8,
+    tool_context: ToolContext = None
+) -> dict:
+    """Generate several variation videos for one product concurrently.
+
+    Use this for A/B testing instead of calling generate_video_from_product
+    once per variation: the scene image and Veo stages of every variation
+    run at the same time, bounded by VIDEO_BATCH_MAX_CONCURRENCY.
+
+    Args:
+        campaign_id: The campaign to generate for
+        product_id: The product ID from products table
+        variations: List of variation dicts, using the same keys as
+            generate_video_from_product (name, model_ethnicity, setting,
+            mood, lighting, activity, camera_movement, time_of_day,
+            visual_style, energy). A name is derived when missing.
+        duration_seconds: Video duration (4, 6, or 8 seconds)
+        tool_context: Optional ADK ToolContext for artifact storage
+
+    Returns:
+        Dictionary with one generate_video_from_product result per variation
+    """
+    if not variations:
+        return {"status": "error", "message": "At least one variation is required"}
+
+    # Every video needs a distinct name, since it becomes part of the filename
+    named = []
+    seen = set()
+    for variation in variations:
+        variation = dict(variation)
+        name = str(variation.get("name") or "-".join(
+            str(variation.get(key) or default)
+            for key, default in (("model_ethnicity", "diverse"), ("setting", "studio"), ("mood", "elegant"))
+        ))
+        base, suffix = name, 2
+        while name in seen:
+            name = f"{base}-{suffix}"
+            suffix += 1
+        seen.add(name)
+        variation["name"] = name
+        named.append(variation)
+
+    semaphore = asyncio.Semaphore(VIDEO_BATCH_MAX_CONCURRENCY)
+
+    async def generate(variation: dict) -> dict:
+        async with semaphore:
+            return await generate_video_from_product(
+                campaign_id=campaign_id,
+                product_id=product_id,
+                variation=variation,
+                duration_seconds=duration_seconds,
+                tool_context=tool_context
+            )
+
+    results = await asyncio.gather(*(generate(v) for v in named))
+    succeeded = sum(1 for r in results if r.get("status") == "success")
+
+    return {
+        "status": "success" if succeeded else "error",
+        "message": f"Generated {succeeded} of {len(results)} videos. Use activate_video to push live.",
+        "generated_count": succeeded,
+        "failed_count": len(results) - succeeded,
+        "results": results,
+        "note": "Videos are in 'generated' status. Metrics will only be created after activation."
+    }
+
+
 def get_variation_presets() -> dict:
     """Get available preset variations for video generation.
 
@@ -0,0 +1,65 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Background warmup of per-process clients at startup.
+
+The first user turn otherwise pays for OAuth token refresh, TLS setup, GCS
+client construction and the one-time tool embedding pass. warm_up() does
+that work once, for all agents together, in a daemon thread right after the
+agent tree is built, so it overlaps with server startup instead of the
+first request.
+"""
+
+import threading
+
+from google.adk.agents import BaseAgent, LlmAgent
+
+from . import storage
+from .embeddings import embed_text
+from .tools.tool_retrieval import RetrievalToolset
+
+
+def _iter_agents(agent: BaseAgent):
+    yield agent
+    for sub_agent in agent.sub_agents:
+        yield from _iter_agents(sub_agent)
+
+
+def warm_up(root_agent: BaseAgent) -> None:
+    """Prime the GCS and embedding clients and precompute tool embeddings."""
+    try:
+        # Builds the storage client (credential discovery) used by media tools
+        storage._get_bucket()
+    except Exception as e:
+        print(f"[Warmup] GCS client skipped: {e}")
+    try:
+        embed_text("warmup")
+        for agent in _iter_agents(root_agent):
+            if not isinstance(agent, LlmAgent):
+                continue
+            for tool in agent.tools:
+                if isinstance(tool, RetrievalToolset):
+                    tool.warm_up()
+        print("[Warmup] Embedding client and tool embeddings ready")
+    except Exception as e:
+        print(f"[Warmup] Skipped: {e}")
+
+
+def start_warmup(root_agent: BaseAgent) -> threading.Thread:
+    """Run warm_up in a daemon thread so import is never blocked."""
+    thread = threading.Thread(
+        target=warm_up, args=(root_agent,), name="agent-warmup", daemon=True
+    )
+    thread.start()
+    return thread
@@ -0,0 +1,390 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for callbacks/.
+
+Tests the model callbacks:
+- before_model_cache_lookup / after_model_cache_store
+- before_model_semantic_route / after_model_record_route
+- after_tool_render_direct / after_agent_emit_direct
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+
+
+def _make_request(text="list campaigns", temperature=0.0):
+    return LlmRequest(
+        model="gemini-test",
+        contents=[types.Content(role="user", parts=[types.Part(text=text)])],
+        config=types.GenerateContentConfig(temperature=temperature),
+    )
+
+
+def _make_response(text="routing"):
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)])
+    )
+
+
+@pytest.fixture
+def callback_context():
+    """Minimal stand-in for CallbackContext with dict-backed state."""
+    context = MagicMock()
+    context.state = {}
+    return context
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    from app.callbacks import llm_response_cache
+
+    llm_response_cache.clear()
+    yield
+    llm_response_cache.clear()
+
+
+class TestLLMResponseCache:
+    """Tests for the exact-match coordinator cache."""
+
+    def test_miss_then_hit(self, callback_context):
+        """A stored response should be replayed for an identical request."""
+        from app.callbacks import before_model_cache_lookup, after_model_cache_store
+
+        assert before_model_cache_lookup(callback_context, _make_request()) is None
+        after_model_cache_store(callback_context, _make_response())
+
+        cached = before_model_cache_lookup(callback_context, _make_request())
+        assert cached is not None
+        assert cached.content.parts[0].text == "routing"
+
+    def test_different_messages_miss(self, callback_context):
+        """Changing the conversation should change the cache key."""
+        from app.callbacks import before_model_cache_lookup, after_model_cache_store
+
+        before_model_cache_lookup(callback_context, _make_request("list campaigns"))
+        after_model_cache_store(callback_context, _make_response())
+
+        assert before_model_cache_lookup(callback_context, _make_request("show metrics")) is None
+
+    def test_nonzero_temperature_not_cached(self, callback_context):
+        """Sampling requests must always go to the model."""
+        from app.callbacks import (
+            before_model_cache_lookup,
+            after_model_cache_store,
+            llm_response_cache,
+        )
+
+        request = _make_request(temperature=0.7)
+        assert before_model_cache_lookup(callback_context, request) is None
+        after_model_cache_store(callback_context, _make_response())
+
+        assert len(llm_response_cache) == 0
+
+    def test_partial_and_error_responses_not_cached(self, callback_context):
+        """Streaming chunks and errors should not be stored."""
+        from app.callbacks import (
+            before_model_cache_lookup,
+            after_model_cache_store,
+            llm_response_cache,
+        )
+
+        before_model_cache_lookup(callback_context, _make_request())
+        partial = _make_response()
+        partial.partial = True
+        after_model_cache_store(callback_context, partial)
+        after_model_cache_store(callback_context, LlmResponse(error_code="500"))
+
+        assert len(llm_response_cache) == 0
+
+    def test_expired_entry_is_dropped(self):
+        """Entries older than the TTL should miss."""
+        from app.callbacks.llm_cache import LLMResponseCache
+
+        cache = LLMResponseCache(ttl_seconds=-1, max_entries=4)
+        cache.set("key", _make_response())
+
+        assert cache.get("key") is None
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when full."""
+        from app.callbacks.llm_cache import LLMResponseCache
+
+        cache = LLMResponseCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", _make_response("a"))
+        cache.set("b", _make_response("b"))
+        cache.get("a")
+        cache.set("c", _make_response("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+
+def _make_transfer_response(agent_name):
+    return LlmResponse(
+        content=types.Content(
+            role="model",
+            parts=[
+                types.Part(
+                    function_call=types.FunctionCall(
+                        name="transfer_to_agent",
+                        args={"agent_name": agent_name},
+                    )
+                )
+            ],
+        )
+    )
+
+
+def _make_routing_request(text):
+    request = _make_request(text)
+    request.tools_dict["transfer_to_agent"] = MagicMock()
+    return request
+
+
+def _route(callback_context, request):
+    from app.callbacks import before_model_semantic_route
+
+    return asyncio.run(before_model_semantic_route(callback_context, request))
+
+
+@pytest.fixture
+def fake_embeddings():
+    """Map message text to fixed unit vectors instead of calling the API."""
+    from app.callbacks import semantic_router
+
+    vectors = {
+        "list campaigns": [1.0, 0.0],
+        "show me my campaigns": [0.99, 0.141],
+        "generate a video": [0.0, 1.0],
+    }
+    semantic_router.clear()
+    with patch("app.callbacks.semantic_router._embed", side_effect=vectors.__getitem__):
+        yield
+    semantic_router.clear()
+
+
+class TestSemanticRouter:
+    """Tests for the embedding-based delegation cache."""
+
+    def test_similar_message_transfers_directly(self, callback_context, fake_embeddings):
+        """A paraphrase of a routed message should skip the coordinator."""
+        from app.callbacks import after_model_record_route
+
+        request = _make_routing_request("list campaigns")
+        assert _route(callback_context, request) is None
+        after_model_record_route(callback_context, _make_transfer_response("campaign_agent"))
+
+        response = _route(
+            callback_context, _make_routing_request("show me my campaigns")
+        )
+        call = response.content.parts[0].function_call
+        assert call.name == "transfer_to_agent"
+        assert call.args == {"agent_name": "campaign_agent"}
+
+    def test_dissimilar_message_falls_through(self, callback_context, fake_embeddings):
+        """Messages below the similarity threshold go to the coordinator."""
+        from app.callbacks import after_model_record_route
+
+        _route(callback_context, _make_routing_request("list campaigns"))
+        after_model_record_route(callback_context, _make_transfer_response("campaign_agent"))
+
+        assert _route(
+            callback_context, _make_routing_request("generate a video")
+        ) is None
+
+    def test_expired_decision_falls_through(self, callback_context, fake_embeddings):
+        """Routing decisions older than the TTL are not reused."""
+        from app.callbacks import after_model_record_route, semantic_router
+
+        _route(callback_context, _make_routing_request("list campaigns"))
+        with patch.object(semantic_router, "ttl_seconds", 0):
+            after_model_record_route(callback_context, _make_transfer_response("campaign_agent"))
+
+        assert _route(
+            callback_context, _make_routing_request("show me my campaigns")
+        ) is None
+        assert len(semantic_router) == 0
+
+    def test_text_reply_is_not_recorded(self, callback_context, fake_embeddings):
+        """Only transfer decisions are remembered."""
+        from app.callbacks import after_model_record_route, semantic_router
+
+        _route(callback_context, _make_routing_request("list campaigns"))
+        after_model_record_route(callback_context, _make_response("Hello!"))
+
+        assert len(semantic_router) == 0
+
+    def test_function_response_turn_is_skipped(self, callback_context, fake_embeddings):
+        """Requests ending on a tool result are not routing decisions."""
+        request = _make_routing_request("list campaigns")
+        request.contents.append(
+            types.Content(
+                role="user",
+                parts=[types.Part.from_function_response(name="x", response={})],
+            )
+        )
+
+        assert _route(callback_context, request) is None
+        assert callback_context.state == {}
+
+
+def _tool_context(state=None, call_id="call-1", turn_calls=None):
+    """Stand-in ToolContext whose session holds the turn's function calls."""
+    turn_calls = turn_calls or [("list_campaigns", call_id)]
+    calls_event = MagicMock()
+    calls_event.get_function_calls.return_value = [
+        types.FunctionCall(name=name, id=id_, args={}) for name, id_ in turn_calls
+    ]
+    context = MagicMock()
+    context.state = {} if state is None else state
+    context.function_call_id = call_id
+    context.session.events = [calls_event]
+    context.actions.skip_summarization = False
+    return context
+
+
+def _agent_context(state):
+    context = MagicMock()
+    context.state = state
+    return context
+
+
+def _tool(name):
+    tool = MagicMock()
+    tool.name = name
+    return tool
+
+
+class TestDirectResponse:
+    """Tests for rendering list tools without an LLM summary."""
+
+    def test_list_tool_skips_summarization_and_replies(self, test_db):
+        """A successful list_campaigns result should be emitted as Markdown."""
+        from app.callbacks import after_tool_render_direct, after_agent_emit_direct
+        from app.tools.campaign_tools import list_campaigns
+
+        tool_context = _tool_context()
+        result = list_campaigns()
+        after_tool_render_direct(_tool("list_campaigns"), {}, tool_context, result)
+
+        assert tool_context.actions.skip_summarization is True
+
+        callback_context = _agent_context(tool_context.state)
+        content = after_agent_emit_direct(callback_context)
+        text = content.parts[0].text
+        assert "| ID | Campaign |" in text
+        assert result["campaigns"][0]["name"] in text
+
+        # Reply is emitted once
+        assert after_agent_emit_direct(callback_context) is None
+
+    def test_other_tools_are_summarized(self):
+        """Tools without a renderer keep the normal LLM summary."""
+        from app.callbacks import after_tool_render_direct, after_agent_emit_direct
+
+        tool_context = _tool_context(turn_calls=[("get_campaign", "call-1")])
+        after_tool_render_direct(_tool("get_campaign"), {}, tool_context, {"status": "success"})
+
+        assert tool_context.actions.skip_summarization is False
+        assert after_agent_emit_direct(_agent_context(tool_context.state)) is None
+
+    def test_errors_are_summarized(self):
+        """Failed list calls go back to the model for an explanation."""
+        from app.callbacks import after_tool_render_direct
+
+        tool_context = _tool_context()
+        after_tool_render_direct(
+            _tool("list_campaigns"), {}, tool_context, {"status": "error", "message": "boom"}
+        )
+
+        assert tool_context.actions.skip_summarization is False
+
+    def test_review_table_is_passed_through(self):
+        """get_video_review_table already returns Markdown."""
+        from app.callbacks import after_tool_render_direct, after_agent_emit_direct
+
+        tool_context = _tool_context(turn_calls=[("get_video_review_table", "call-1")])
+        after_tool_render_direct(
+            _tool("get_video_review_table"), {}, tool_context,
+            {"status": "success", "table": "| ID |\n|---|\n| 1 |"},
+        )
+
+        content = after_agent_emit_direct(_agent_context(tool_context.state))
+        assert content.parts[0].text == "| ID |\n|---|\n| 1 |"
+
+    def test_parallel_call_without_renderer_keeps_summary(self):
+        """One unrendered call in the turn means the model summarizes all of them."""
+        from app.callbacks import after_tool_render_direct, after_agent_emit_direct
+
+        state = {}
+        turn = [("list_products", "call-1"), ("list_campaign_videos", "call-2")]
+        products_context = _tool_context(state, "call-1", turn)
+        videos_context = _tool_context(state, "call-2", turn)
+
+        after_tool_render_direct(
+            _tool("list_products"), {}, products_context,
+            {"status": "success", "product_count": 0, "products": []},
+        )
+        after_tool_render_direct(
+            _tool("list_campaign_videos"), {}, videos_context, {"status": "success"},
+        )
+
+        assert products_context.actions.skip_summarization is False
+        assert videos_context.actions.skip_summarization is False
+        assert after_agent_emit_direct(_agent_context(state)) is None
+
+    def test_parallel_rendered_calls_are_all_emitted(self):
+        """When every call renders, all results are emitted in call order."""
+        from app.callbacks import after_tool_render_direct, after_agent_emit_direct
+
+        state = {}
+        turn = [("get_video_review_table", "call-1"), ("list_pending_videos", "call-2")]
+        pending_context = _tool_context(state, "call-2", turn)
+        table_context = _tool_context(state, "call-1", turn)
+
+        after_tool_render_direct(
+            _tool("list_pending_videos"), {}, pending_context,
+            {"status": "success", "message": "No pending videos", "videos": []},
+        )
+        assert pending_context.actions.skip_summarization is False
+
+        after_tool_render_direct(
+            _tool("get_video_review_table"), {}, table_context,
+            {"status": "success", "table": "| ID |"},
+        )
+        assert table_context.actions.skip_summarization is True
+
+        content = after_agent_emit_direct(_agent_context(state))
+        assert content.parts[0].text == "| ID |\n\nNo pending videos"
+
+    def test_products_keep_image_links(self):
+        """The list_products table should link each product image."""
+        from app.callbacks import after_tool_render_direct, after_agent_emit_direct
+
+        tool_context = _tool_context(turn_calls=[("list_products", "call-1")])
+        after_tool_render_direct(
+            _tool("list_products"), {}, tool_context,
+            {"status": "success", "product_count": 1, "products": [
+                {"id": 1, "name": "dress", "image_url": "https://example.com/dress.png"},
+            ]},
+        )
+
+        text = after_agent_emit_direct(_agent_context(tool_context.state)).parts[0].text
+        assert "[View](https://example.com/dress.png)" in text
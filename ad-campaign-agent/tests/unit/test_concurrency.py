@@ -0,0 +1,102 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for tools/concurrency.py.
+
+Tests the helpers that offload synchronous tools:
+- run_in_thread
+- parallel_tools
+- CachedFunctionTool
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+
+
+def _sync_tool(campaign_id: int, days: int = 30) -> dict:
+    """Return the thread the tool ran on."""
+    return {"campaign_id": campaign_id, "thread": threading.get_ident()}
+
+
+class TestRunInThread:
+    """Tests for run_in_thread."""
+
+    def test_wrapper_is_coroutine_with_same_signature(self):
+        """ADK should see the original name, docstring and parameters."""
+        from app.tools.concurrency import run_in_thread
+
+        wrapped = run_in_thread(_sync_tool)
+
+        assert inspect.iscoroutinefunction(wrapped)
+        assert wrapped.__name__ == "_sync_tool"
+        assert wrapped.__doc__ == _sync_tool.__doc__
+        assert inspect.signature(wrapped) == inspect.signature(_sync_tool)
+
+    def test_runs_off_event_loop_thread(self):
+        """The wrapped function should execute in a worker thread."""
+        from app.tools.concurrency import run_in_thread
+
+        result = asyncio.run(run_in_thread(_sync_tool)(campaign_id=1))
+
+        assert result["campaign_id"] == 1
+        assert result["thread"] != threading.get_ident()
+
+    def test_async_tools_unchanged(self):
+        """Coroutine tools are returned as-is."""
+        from app.tools.concurrency import run_in_thread
+
+        async def async_tool():
+            return None
+
+        assert run_in_thread(async_tool) is async_tool
+
+    def test_parallel_calls_overlap(self):
+        """Gathered blocking tools should take max, not sum, of their latency."""
+        from app.tools.concurrency import parallel_tools
+
+        def slow_tool() -> None:
+            time.sleep(0.2)
+
+        tools = parallel_tools([slow_tool, slow_tool, slow_tool])
+
+        async def run_all():
+            await asyncio.gather(*(tool.func() for tool in tools))
+
+        start = time.perf_counter()
+        asyncio.run(run_all())
+
+        assert time.perf_counter() - start < 0.5
+
+
+class TestCachedFunctionTool:
+    """Tests for the memoized function declaration."""
+
+    def test_declaration_built_once(self):
+        """The declaration should match FunctionTool and be built only once."""
+        from unittest.mock import patch
+        from google.adk.tools import FunctionTool
+        from app.tools.cached_function_tool import CachedFunctionTool
+
+        tool = CachedFunctionTool(_sync_tool)
+        expected = FunctionTool(_sync_tool)._get_declaration()
+
+        with patch.object(FunctionTool, "_get_declaration", return_value=expected) as build:
+            first = tool._get_declaration()
+            second = tool._get_declaration()
+
+        assert build.call_count == 1
+        assert first == second == expected
+        assert first is not second
@@ -0,0 +1,423 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for database/db.py.
+
+Tests the database bootstrap helpers:
+- get_schema_version / set_schema_version
+- is_database_initialized
+- init_database / reset_database fast paths
+- run_migrations
+- get_pooled_connection / get_db_cursor
+- start_background_bootstrap / wait_until_ready
+- product catalog cache
+- populate_mock_data transaction handling
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture
+def empty_db_path():
+    """Point the db module at an empty temporary database file."""
+    fd, db_path = tempfile.mkstemp(suffix=".db", prefix="test_empty_")
+    os.close(fd)
+
+    with patch("app.database.db.DB_PATH", db_path):
+        yield db_path
+
+    for path in (db_path, db_path + "-wal", db_path + "-shm"):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+class TestSchemaVersion:
+    """Tests for the PRAGMA user_version bootstrap gate."""
+
+    def test_new_database_is_not_initialized(self, empty_db_path):
+        """A brand new database file should report version 0."""
+        from app.database.db import get_schema_version, is_database_initialized
+
+        assert get_schema_version() == 0
+        assert is_database_initialized() is False
+
+    def test_set_schema_version_marks_initialized(self, empty_db_path):
+        """Stamping the current version should short-circuit the gate."""
+        from app.database.db import (
+            SCHEMA_VERSION,
+            get_schema_version,
+            is_database_initialized,
+            set_schema_version,
+        )
+
+        set_schema_version()
+
+        assert get_schema_version() == SCHEMA_VERSION
+        assert is_database_initialized() is True
+
+    def test_older_version_is_not_initialized(self, empty_db_path):
+        """A database stamped with an older version should be rebuilt."""
+        from app.database.db import (
+            SCHEMA_VERSION,
+            is_database_initialized,
+            set_schema_version,
+        )
+
+        set_schema_version(SCHEMA_VERSION - 1)
+
+        assert is_database_initialized() is False
+
+
+class TestInitDatabase:
+    """Tests for the init_database() fast paths."""
+
+    def _tables(self):
+        from app.database.db import get_db_cursor
+
+        with get_db_cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            return {row[0] for row in cursor.fetchall()}
+
+    def test_creates_schema(self, empty_db_path):
+        """A new database should get every table."""
+        from app.database.db import init_database
+
+        init_database()
+
+        assert {"campaigns", "products", "campaign_videos", "video_metrics"} <= self._tables()
+
+    def test_stamped_database_skips_ddl(self, empty_db_path):
+        """A database at the current version should not be touched."""
+        from app.database.db import init_database, set_schema_version
+
+        set_schema_version()
+        init_database()
+
+        assert "campaigns" not in self._tables()
+
+    def test_reset_rebuilds_stamped_database(self, empty_db_path):
+        """reset_database() should clear the version and recreate tables."""
+        from app.database.db import (
+            get_schema_version,
+            init_database,
+            reset_database,
+            set_schema_version,
+        )
+
+        init_database()
+        set_schema_version()
+        reset_database()
+
+        assert get_schema_version() == 0
+        assert "campaigns" in self._tables()
+
+
+class TestRunMigrations:
+    """Tests for run_migrations() on an older schema."""
+
+    def test_adds_missing_columns(self, empty_db_path):
+        """Every missing column should be added in one pass."""
+        from app.database.db import get_db_cursor, run_migrations
+
+        with get_db_cursor() as cursor:
+            cursor.execute("CREATE TABLE campaigns (id INTEGER PRIMARY KEY, name TEXT)")
+            cursor.execute("CREATE TABLE campaign_ads (id INTEGER PRIMARY KEY, video_path TEXT)")
+            cursor.execute("CREATE TABLE campaign_metrics (id INTEGER PRIMARY KEY, date DATE)")
+
+        run_migrations()
+
+        with get_db_cursor() as cursor:
+            columns = {}
+            for table in ("campaigns", "campaign_ads", "campaign_metrics"):
+                cursor.execute(f"PRAGMA table_info({table})")
+                columns[table] = {row[1] for row in cursor.fetchall()}
+
+        assert {"product_id", "store_name"} <= columns["campaigns"]
+        assert "video_properties" in columns["campaign_ads"]
+        assert {"dwell_time", "circulation"} <= columns["campaign_metrics"]
+
+
+class TestConnectionPool:
+    """Tests for the per-thread pooled connection."""
+
+    def test_same_thread_reuses_connection(self, empty_db_path):
+        """Repeated calls on one thread should share a connection."""
+        from app.database.db import get_pooled_connection
+
+        assert get_pooled_connection() is get_pooled_connection()
+
+    def test_threads_get_separate_connections(self, empty_db_path):
+        """sqlite3 connections must not be shared across threads."""
+        from app.database.db import get_pooled_connection
+
+        main_conn = get_pooled_connection()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(get_pooled_connection()))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_conn
+
+    def test_connections_use_wal(self, empty_db_path):
+        """Connections should be tuned with WAL journaling."""
+        from app.database.db import get_db_cursor
+
+        with get_db_cursor() as cursor:
+            cursor.execute("PRAGMA journal_mode")
+            assert cursor.fetchone()[0] == "wal"
+
+    def test_cursor_rolls_back_on_error(self, empty_db_path):
+        """A failing block should not leave partial writes behind."""
+        from app.database.db import get_db_cursor
+
+        with get_db_cursor() as cursor:
+            cursor.execute("CREATE TABLE t (x INTEGER)")
+
+        with pytest.raises(RuntimeError):
+            with get_db_cursor() as cursor:
+                cursor.execute("INSERT INTO t VALUES (1)")
+                raise RuntimeError("boom")
+
+        with get_db_cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM t")
+            assert cursor.fetchone()[0] == 0
+
+    def test_nested_cursor_does_not_commit_outer_block(self, empty_db_path):
+        """An outer failure should undo writes made by a nested block."""
+        from app.database.db import get_db_cursor
+
+        with get_db_cursor() as cursor:
+            cursor.execute("CREATE TABLE t (x INTEGER)")
+
+        with pytest.raises(RuntimeError):
+            with get_db_cursor() as outer:
+                outer.execute("INSERT INTO t VALUES (1)")
+                with get_db_cursor() as inner:
+                    inner.execute("INSERT INTO t VALUES (2)")
+                raise RuntimeError("boom")
+
+        with get_db_cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM t")
+            assert cursor.fetchone()[0] == 0
+
+    def test_nested_cursor_failure_keeps_outer_writes(self, empty_db_path):
+        """A failing nested block should only undo its own writes."""
+        from app.database.db import get_db_cursor
+
+        with get_db_cursor() as cursor:
+            cursor.execute("CREATE TABLE t (x INTEGER)")
+
+        with get_db_cursor() as outer:
+            outer.execute("INSERT INTO t VALUES (1)")
+            with pytest.raises(RuntimeError):
+                with get_db_cursor() as inner:
+                    inner.execute("INSERT INTO t VALUES (2)")
+                    raise RuntimeError("boom")
+
+        with get_db_cursor() as cursor:
+            cursor.execute("SELECT x FROM t")
+            assert [row[0] for row in cursor.fetchall()] == [1]
+
+
+    def test_overlapping_coroutines_do_not_share_transactions(self, empty_db_path):
+        """Interleaved coroutine blocks must not commit or see each other's writes."""
+        from app.database.db import get_db_cursor
+
+        with get_db_cursor() as cursor:
+            cursor.execute("CREATE TABLE t (x INTEGER)")
+
+        writer_paused = asyncio.Event()
+        reader_done = asyncio.Event()
+        seen = []
+
+        async def writer():
+            with get_db_cursor() as cursor:
+                cursor.execute("INSERT INTO t VALUES (1)")
+                writer_paused.set()
+                await reader_done.wait()
+                raise RuntimeError("boom")
+
+        async def reader():
+            await writer_paused.wait()
+            with get_db_cursor() as cursor:
+                cursor.execute("SELECT COUNT(*) FROM t")
+                seen.append(cursor.fetchone()[0])
+            reader_done.set()
+
+        async def main():
+            results = await asyncio.gather(writer(), reader(), return_exceptions=True)
+            assert isinstance(results[0], RuntimeError)
+            assert results[1] is None
+
+        asyncio.run(main())
+
+        assert seen == [0]
+        with get_db_cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM t")
+            assert cursor.fetchone()[0] == 0
+
+    def test_nesting_is_tracked_per_coroutine(self, empty_db_path):
+        """Nested blocks share their own task's transaction, not another's."""
+        from app.database.db import get_db_cursor
+
+        with get_db_cursor() as cursor:
+            cursor.execute("CREATE TABLE t (x INTEGER)")
+
+        async def reader():
+            with get_db_cursor() as outer:
+                with get_db_cursor() as inner:
+                    inner.execute("SELECT COUNT(*) FROM t")
+                    await asyncio.sleep(0)
+                outer.execute("SELECT COUNT(*) FROM t")
+
+        async def writer():
+            with pytest.raises(RuntimeError):
+                with get_db_cursor() as outer:
+                    outer.execute("INSERT INTO t VALUES (1)")
+                    with get_db_cursor() as inner:
+                        inner.execute("INSERT INTO t VALUES (2)")
+                    raise RuntimeError("boom")
+
+        async def main():
+            await asyncio.gather(reader(), reader(), writer())
+
+        asyncio.run(main())
+
+        with get_db_cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM t")
+            assert cursor.fetchone()[0] == 0
+
+class TestBackgroundBootstrap:
+    """Tests for start_background_bootstrap / wait_until_ready."""
+
+    def test_cursor_waits_for_bootstrap(self, empty_db_path):
+        """Tool queries should block until seeding has finished."""
+        from app.database.db import get_db_cursor, start_background_bootstrap
+
+        release = threading.Event()
+
+        def bootstrap():
+            release.wait()
+            with get_db_cursor() as cursor:
+                cursor.execute("CREATE TABLE t (x INTEGER)")
+
+        start_background_bootstrap(bootstrap)
+        threading.Timer(0.05, release.set).start()
+
+        with get_db_cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM t")
+            assert cursor.fetchone()[0] == 0
+
+    def test_bootstrap_failure_is_raised(self, empty_db_path):
+        """A failed bootstrap should surface on the next database access."""
+        from app.database.db import get_db_cursor, start_background_bootstrap
+
+        def bootstrap():
+            raise ValueError("boom")
+
+        start_background_bootstrap(bootstrap).join()
+
+        with pytest.raises(RuntimeError):
+            with get_db_cursor():
+                pass
+
+        # Later tests must not inherit the failure
+        start_background_bootstrap(lambda: None).join()
+
+    def test_async_wait_does_not_block_event_loop(self, empty_db_path):
+        """Coroutines should keep running while seeding is in progress."""
+        from app.database.db import start_background_bootstrap, wait_until_ready_async
+
+        release = threading.Event()
+        start_background_bootstrap(release.wait)
+
+        async def main():
+            waiter = asyncio.create_task(wait_until_ready_async())
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+            # Runs on the loop, so it would never execute if the wait blocked
+            release.set()
+            await asyncio.wait_for(waiter, timeout=5)
+
+        asyncio.run(main())
+
+
+class TestProductCatalogCache:
+    """Tests for the in-memory product catalog."""
+
+    def test_lookups_served_from_one_read(self, empty_db_path):
+        """Catalog lookups should not query SQLite again within the TTL."""
+        from app.database import db
+
+        db.init_database()
+        db.list_products()
+
+        with patch.object(db, "get_db_cursor", side_effect=AssertionError("queried")):
+            product = db.list_products()[0]
+            assert db.get_product(product["id"]) == product
+            assert db.get_product_by_name(product["name"]) == product
+            assert all(p["category"] == "dress" for p in db.list_products("dress"))
+
+    def test_returned_products_are_copies(self, empty_db_path):
+        """Mutating a returned product must not affect the cache."""
+        from app.database import db
+
+        db.init_database()
+        product = db.list_products()[0]
+        product["name"] = "changed"
+
+        assert db.get_product(product["id"])["name"] != "changed"
+
+    def test_invalidate_rereads_catalog(self, empty_db_path):
+        """invalidate_product_cache() should pick up new rows."""
+        from app.database import db
+
+        db.init_database()
+        count = len(db.list_products())
+        with db.get_db_cursor() as cursor:
+            cursor.execute("INSERT INTO products (name, image_filename) VALUES ('new-item', 'x.png')")
+
+        assert len(db.list_products()) == count
+        db.invalidate_product_cache()
+        assert len(db.list_products()) == count + 1
+
+
+class TestPopulateMockData:
+    """Tests for the mock data seed transaction."""
+
+    def test_failed_seed_rolls_back(self, empty_db_path):
+        """An error mid-seed should leave no campaigns behind."""
+        from app.database import db, mock_data
+
+        db.init_database()
+        with patch.object(mock_data, "_generate_mock_video_metrics",
+                          side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                mock_data.populate_mock_data()
+
+        with db.get_db_cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM campaigns")
+            assert cursor.fetchone()[0] == 0
+
+        result = mock_data.populate_mock_data()
+        assert result["status"] == "success"
+        assert mock_data.populate_mock_data()["status"] == "skipped"
@@ -0,0 +1,97 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for storage.py.
+
+Tests the cached seed image listing:
+- Local listings revalidated by directory mtime
+- GCS listings reused until the TTL expires or an image is saved
+"""
+
+import os
+import tempfile
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+@pytest.fixture(autouse=True)
+def clear_listing_cache():
+    """Start each test with an empty listing cache."""
+    from app import storage
+
+    storage._invalidate_seed_images()
+    yield
+    storage._invalidate_seed_images()
+
+
+class TestListSeedImagesLocal:
+    """Tests for local-mode listings."""
+
+    def test_new_file_invalidates_cache(self):
+        """Adding an image should show up on the next listing."""
+        from app import storage
+
+        with tempfile.TemporaryDirectory() as selected_dir, \
+                patch("app.config.GCS_BUCKET", ""), \
+                patch("app.config.SELECTED_DIR", selected_dir):
+            open(os.path.join(selected_dir, "a.jpg"), "wb").close()
+            assert storage.list_seed_images() == ["a.jpg"]
+
+            storage.save_image("b.png", b"png")
+            assert sorted(storage.list_seed_images()) == ["a.jpg", "b.png"]
+
+    def test_missing_directory_returns_empty(self):
+        """A missing local directory should list no images."""
+        from app import storage
+
+        with patch("app.config.GCS_BUCKET", ""), \
+                patch("app.config.SELECTED_DIR", "/nonexistent/selected"):
+            assert storage.list_seed_images() == []
+
+
+class TestListSeedImagesGcs:
+    """Tests for GCS-mode listings."""
+
+    def _bucket(self, names):
+        bucket = MagicMock()
+        bucket.list_blobs.return_value = [MagicMock(name=n) for n in names]
+        for blob, name in zip(bucket.list_blobs.return_value, names):
+            blob.name = name
+        return bucket
+
+    def test_listing_is_reused_within_ttl(self):
+        """Repeated listings should hit the bucket once."""
+        from app import storage
+
+        bucket = self._bucket(["seed-images/", "seed-images/a.jpg"])
+        with patch("app.config.GCS_BUCKET", "bucket"), \
+                patch.object(storage, "_get_bucket", return_value=bucket):
+            assert storage.list_seed_images() == ["a.jpg"]
+            assert storage.list_seed_images() == ["a.jpg"]
+
+        assert bucket.list_blobs.call_count == 1
+
+    def test_save_image_invalidates_listing(self):
+        """Uploading an image should force a fresh listing."""
+        from app import storage
+
+        bucket = self._bucket(["seed-images/a.jpg"])
+        with patch("app.config.GCS_BUCKET", "bucket"), \
+                patch.object(storage, "_get_bucket", return_value=bucket):
+            storage.list_seed_images()
+            storage.save_image("b.png", b"png")
+            storage.list_seed_images()
+
+        assert bucket.list_blobs.call_count == 2
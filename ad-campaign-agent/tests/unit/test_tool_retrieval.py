@@ -0,0 +1,184 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for tools/tool_retrieval.py.
+
+Tests RetrievalToolset selection and fallback behaviour.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from google.genai import types
+
+
+def core_tool() -> dict:
+    """Always available tool."""
+    return {}
+
+
+def image_tool() -> dict:
+    """Work with seed images."""
+    return {}
+
+
+def video_tool() -> dict:
+    """Work with legacy videos."""
+    return {}
+
+
+def _fake_embed(text, task_type=None):
+    """Embed by keyword so similarity is predictable."""
+    return [1.0, 0.0] if "image" in text else [0.0, 1.0]
+
+
+def _context(text):
+    context = MagicMock()
+    context.user_content = types.Content(role="user", parts=[types.Part(text=text)])
+    return context
+
+
+def _names(tools):
+    return [tool.name for tool in tools]
+
+
+def _llm_request(tools):
+    """Register a turn's tools on an LlmRequest the way ADK's flow does."""
+    from google.adk.models.llm_request import LlmRequest
+
+    llm_request = LlmRequest()
+    for tool in tools:
+        asyncio.run(tool.process_llm_request(tool_context=MagicMock(), llm_request=llm_request))
+    return llm_request
+
+
+def _declared(llm_request):
+    return [
+        declaration.name
+        for tool in llm_request.config.tools or []
+        for declaration in tool.function_declarations or []
+    ]
+
+
+@pytest.fixture
+def toolset():
+    from app.tools.tool_retrieval import RetrievalToolset
+
+    return RetrievalToolset(
+        core_tools=[core_tool],
+        optional_tools=[image_tool, video_tool],
+        top_k=1,
+        index_path=None,
+    )
+
+
+class TestRetrievalToolset:
+    """Tests for RetrievalToolset.get_tools."""
+
+    def test_selects_most_similar_optional_tool(self, toolset):
+        """Core tools plus the closest optional tool should be exposed."""
+        with patch("app.tools.tool_retrieval.embed_text", side_effect=_fake_embed):
+            tools = asyncio.run(toolset.get_tools(_context("add an image")))
+
+        assert _declared(_llm_request(tools)) == ["core_tool", "image_tool"]
+
+    def test_filtered_out_tool_is_still_callable(self, toolset):
+        """A call to a tool retrieval left undeclared must not crash the turn."""
+        from google.adk.flows.llm_flows.functions import _get_tool
+
+        with patch("app.tools.tool_retrieval.embed_text", side_effect=_fake_embed):
+            tools = asyncio.run(toolset.get_tools(_context("add an image")))
+        llm_request = _llm_request(tools)
+        assert "video_tool" not in _declared(llm_request)
+
+        call = types.FunctionCall(name="video_tool", args={})
+        tool = _get_tool(call, llm_request.tools_dict)
+        result = asyncio.run(tool.run_async(args={}, tool_context=MagicMock()))
+
+        assert tool.name == "video_tool"
+        assert result == {}
+
+    def test_query_embedding_is_cached(self, toolset):
+        """Repeated calls in a turn should not re-embed the message."""
+        with patch("app.tools.tool_retrieval.embed_text", side_effect=_fake_embed) as embed:
+            asyncio.run(toolset.get_tools(_context("show videos")))
+            asyncio.run(toolset.get_tools(_context("show videos")))
+
+        # 2 tool embeddings + 1 query embedding
+        assert embed.call_count == 3
+
+    def test_embedding_failure_returns_all_tools(self, toolset):
+        """Retrieval errors must never hide tools."""
+        with patch("app.tools.tool_retrieval.embed_text", side_effect=RuntimeError("offline")):
+            tools = asyncio.run(toolset.get_tools(_context("show videos")))
+
+        assert _names(tools) == ["core_tool", "image_tool", "video_tool"]
+
+    def test_no_context_returns_all_tools(self, toolset):
+        """Without a user message every tool is exposed."""
+        tools = asyncio.run(toolset.get_tools(None))
+
+        assert len(tools) == 3
+
+    def test_tool_index_persists_across_instances(self, tmp_path):
+        """A second toolset should load tool embeddings from disk."""
+        from app.tools.tool_retrieval import RetrievalToolset
+
+        index_path = str(tmp_path / "tool_embeddings.json")
+
+        def make_toolset():
+            return RetrievalToolset(
+                core_tools=[core_tool],
+                optional_tools=[image_tool, video_tool],
+                top_k=1,
+                index_path=index_path,
+            )
+
+        with patch("app.tools.tool_retrieval.embed_text", side_effect=_fake_embed) as embed:
+            make_toolset().warm_up()
+            make_toolset().warm_up()
+
+        assert embed.call_count == 2
+
+    def test_warmup_precomputes_tool_embeddings(self, toolset):
+        """warm_up walks the agent tree and embeds retrieval toolsets once."""
+        from google.adk.agents import LlmAgent
+        from app.warmup import warm_up
+
+        agent = LlmAgent(name="root", sub_agents=[LlmAgent(name="media", tools=[toolset])])
+        with patch("app.warmup.embed_text", side_effect=_fake_embed), \
+                patch("app.tools.tool_retrieval.embed_text", side_effect=_fake_embed) as embed:
+            warm_up(agent)
+            asyncio.run(toolset.get_tools(_context("show videos")))
+
+        # 2 tool embeddings during warmup + 1 query embedding for the turn
+        assert embed.call_count == 3
+
+    def test_cached_agents_declare_fixed_tools(self):
+        """Agents under context caching must not trim declarations per turn."""
+        from app.agent import app
+        from app.tools.tool_retrieval import RetrievalToolset
+
+        assert app.context_cache_config is not None
+
+        def walk(agent):
+            yield agent
+            for sub_agent in agent.sub_agents:
+                yield from walk(sub_agent)
+
+        for agent in walk(app.root_agent):
+            for tool in getattr(agent, "tools", []):
+                assert not isinstance(tool, RetrievalToolset), agent.name
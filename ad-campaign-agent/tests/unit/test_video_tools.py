@@ -21,6 +21,7 @@ Tests the video-related tools:
 - list_campaign_ads (legacy, no LLM)
 - generate_video_from_product (marked slow - uses Veo)
 - generate_video_with_variation (marked slow - uses Veo)
+- generate_video_batch (generation mocked)
 """
 
 import pytest
@@ -242,6 +243,81 @@ class TestVideoGenerationParameters:
             pass
 
 
+class TestGenerateVideoBatch:
+    """Tests for generate_video_batch (generation itself is mocked)."""
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_every_variation(self):
+        """Each variation should be generated once, with a unique name."""
+        from app.tools.video_tools import generate_video_batch
+
+        with patch(
+            "app.tools.video_tools.generate_video_from_product",
+            new=AsyncMock(return_value={"status": "success"}),
+        ) as mock_generate:
+            result = await generate_video_batch(
+                campaign_id=1,
+                product_id=1,
+                variations=[
+                    {"setting": "beach"},
+                    {"setting": "beach"},
+                    {"name": "night-out", "time_of_day": "night"},
+                ],
+            )
+
+        names = [c.kwargs["variation"]["name"] for c in mock_generate.call_args_list]
+        assert names == ["diverse-beach-elegant", "diverse-beach-elegant-2", "night-out"]
+        assert result["generated_count"] == 3
+        assert result["failed_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_names_non_string_values(self):
+        """Derived names should tolerate non-string and null variation values."""
+        from app.tools.video_tools import generate_video_batch
+
+        with patch(
+            "app.tools.video_tools.generate_video_from_product",
+            new=AsyncMock(return_value={"status": "success"}),
+        ) as mock_generate:
+            await generate_video_batch(
+                campaign_id=1,
+                product_id=1,
+                variations=[{"setting": 3, "mood": None}],
+            )
+
+        names = [c.kwargs["variation"]["name"] for c in mock_generate.call_args_list]
+        assert names == ["diverse-3-elegant"]
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_concurrency_limit(self):
+        """No more than VIDEO_BATCH_MAX_CONCURRENCY generations run at once."""
+        import asyncio
+        from app.tools.video_tools import generate_video_batch
+
+        running = 0
+        peak = 0
+
+        async def fake_generate(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"status": "error"}
+
+        with patch("app.tools.video_tools.VIDEO_BATCH_MAX_CONCURRENCY", 2), \
+                patch("app.tools.video_tools.generate_video_from_product", new=fake_generate):
+            result = await generate_video_batch(
+                campaign_id=1,
+                product_id=1,
+                variations=[{"name": f"v{i}"} for i in range(5)],
+            )
+
+        assert peak == 2
+        assert result["status"] == "error"
+        assert result["failed_count"] == 5
+
+
 @pytest.mark.slow
 @pytest.mark.veo
 class TestVideoGenerationIntegration: